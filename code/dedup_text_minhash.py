@@ -0,0 +1,11 @@
+"""
+Near-duplicate Detection over Loan Text Fields (MinHash + LSH)
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/dedup_text_minhash.py.
+"""
+
+from p2p_credit_risk.dedup_text_minhash import main
+
+if __name__ == '__main__':
+    clusters = main()
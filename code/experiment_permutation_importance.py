@@ -0,0 +1,11 @@
+"""
+Permutation Feature Importance for the Table 4-1 Models and Text-only Stages
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/experiment_permutation_importance.py.
+"""
+
+from p2p_credit_risk.experiment_permutation_importance import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+"""
+Threshold Analysis: Recall, Precision, F1, Expected Loss and Approval Rate Curves
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/experiment_threshold_analysis.py.
+"""
+
+from p2p_credit_risk.experiment_threshold_analysis import main
+
+if __name__ == '__main__':
+    all_results = main()
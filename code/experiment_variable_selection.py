@@ -0,0 +1,11 @@
+"""
+Variable Subset Search: Forward, Backward and Beam Search over Structured Variables
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/experiment_variable_selection.py.
+"""
+
+from p2p_credit_risk.experiment_variable_selection import main
+
+if __name__ == '__main__':
+    path_df, evaluated_df = main()
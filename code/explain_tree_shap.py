@@ -0,0 +1,11 @@
+"""
+Batch TreeSHAP Explanations with Default-Probability Scores
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/explain_tree_shap.py.
+"""
+
+from p2p_credit_risk.explain_tree_shap import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+"""
+Unified Command-line Interface
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/cli.py.
+"""
+
+from p2p_credit_risk.cli import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+"""
+Korean P2P Lending Credit Risk Analysis
+
+Tables, experiments and scoring. The scripts in code/ and the
+p2p-credit-risk command (p2p_credit_risk.cli) are thin entry points to
+the modules of this package; see config for the input and output paths.
+"""
@@ -0,0 +1,127 @@
+"""
+Unified Command-line Interface
+Korean P2P Lending Credit Risk Analysis
+
+One entry point for tables, experiments and scoring. Script modules (and
+pandas, scikit-learn, scipy) are imported only when a command runs, so
+--help and argument errors return immediately. The global path options are
+applied with config.configure() on every call of main(), so repeated
+in-process calls with different paths each use their own locations.
+
+Usage:
+    p2p-credit-risk tables all
+    p2p-credit-risk --pkl-dir /data/pkl experiment text
+    p2p-credit-risk experiment selection --method beam --model GB
+    p2p-credit-risk score --models GB
+    p2p-credit-risk sweep worker --queue /shared/sweep
+    p2p-credit-risk warehouse history --experiment text_only_complete --metric roc_auc
+
+The same functions are importable for in-process reuse, e.g. from a
+long-lived worker:
+    from p2p_credit_risk.experiment_text_only_complete_metrics import load_stage, evaluate_seed
+"""
+
+import argparse
+import importlib
+import sys
+
+# tables: name -> (module, function)
+TABLES = {
+    '2-1': ('generate_table_2_1_repayment_distribution', 'generate_repayment_distribution'),
+    '2-2': ('generate_table_2_2_descriptive_statistics', 'generate_descriptive_statistics'),
+    '2-3': ('generate_table_2_3_text_statistics', 'generate_text_statistics'),
+    '4-1': ('generate_table_4_1_model_performance', 'generate_model_performance_table_with_ci'),
+    '4-2': ('generate_table_4_2_formatted', 'generate_formatted_table'),
+    '4-2-stages': ('generate_table_4_2_text_only_performance', 'generate_text_only_performance_table'),
+}
+
+# experiments: name -> (module, main function, help)
+EXPERIMENTS = {
+    'text': ('experiment_text_only_complete_metrics', 'main', 'text-only stages, 5 metrics'),
+    'text-v2': ('experiment_text_only_v2', 'main', 'text-only stages, ROC-AUC/Recall/F1 with ranges'),
+    'threshold': ('experiment_threshold_analysis', 'main', 'threshold, cost and approval-rate curves'),
+    'selection': ('experiment_variable_selection', 'main', 'forward/backward/beam variable subset search'),
+    'importance': ('experiment_permutation_importance', 'main', 'permutation feature importance'),
+}
+
+# commands that forward their remaining arguments to a script's main(argv)
+FORWARDED = {
+    'score': ('explain_tree_shap', 'main', 'default-probability scores with TreeSHAP attributions'),
+    'refresh': ('refresh_tables_incremental', 'main', 'fold new loan rows into Tables 2-1, 2-2, 2-3'),
+    'dedup': ('dedup_text_minhash', 'main', 'near-duplicate clusters over loan texts'),
+    'sweep': ('sweep_queue', 'main', 'shared-filesystem job queue (submit/worker/assemble)'),
+    'warehouse': ('results_warehouse', 'main', 'SQLite store of per-seed results (ingest/runs/history)'),
+}
+
+# global option -> config location
+PATH_OPTIONS = {
+    'root': 'root',
+    'data': 'data_path',
+    'pkl_dir': 'pkl_dir',
+    'tables_dir': 'tables_dir',
+    'results_dir': 'results_dir',
+}
+
+def _import(module_name):
+    """Import a module of this package on demand"""
+    return importlib.import_module(f'{__package__}.{module_name}')
+
+def _call(module_name, function_name, *args):
+    """Import a script module on demand and call one of its functions"""
+    return getattr(_import(module_name), function_name)(*args)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='p2p-credit-risk',
+        description='Korean P2P lending credit risk analysis: tables, experiments and scoring',
+    )
+    parser.add_argument('--root', help='repository root (P2P_ROOT)')
+    parser.add_argument('--data', help='raw workbook path (P2P_DATA_PATH)')
+    parser.add_argument('--pkl-dir', help='text-stage PKL directory (P2P_PKL_DIR)')
+    parser.add_argument('--tables-dir', help='generated tables directory (P2P_TABLES_DIR)')
+    parser.add_argument('--results-dir', help='experiment results directory (P2P_RESULTS_DIR)')
+
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('tables', help='generate tables')
+    p.add_argument('tables', nargs='+', choices=list(TABLES) + ['all'])
+
+    p = sub.add_parser('experiment', help='run an experiment')
+    p.add_argument('name', choices=list(EXPERIMENTS),
+                   help='; '.join(f'{k}: {v[2]}' for k, v in EXPERIMENTS.items()))
+    p.add_argument('args', nargs=argparse.REMAINDER, help='arguments passed to the experiment')
+
+    for name, (_, _, help_text) in FORWARDED.items():
+        p = sub.add_parser(name, help=help_text, add_help=False)
+        p.add_argument('args', nargs=argparse.REMAINDER)
+
+    return parser
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args, extra = build_parser().parse_known_args(argv)
+    if args.command in FORWARDED:
+        # everything after the command name belongs to the script, options included
+        args.args = argv[argv.index(args.command) + 1:]
+    elif extra:
+        build_parser().error(f"unrecognized arguments: {' '.join(extra)}")
+
+    _import('config').configure(
+        **{name: getattr(args, option) for option, name in PATH_OPTIONS.items()}
+    )
+
+    if args.command == 'tables':
+        names = list(TABLES) if 'all' in args.tables else args.tables
+        for name in names:
+            _call(*TABLES[name])
+        return
+
+    if args.command == 'experiment':
+        module_name, function_name, _ = EXPERIMENTS[args.name]
+        return _call(module_name, function_name, args.args)
+
+    module_name, function_name, _ = FORWARDED[args.command]
+    return _call(module_name, function_name, args.args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Configurable Paths
+Korean P2P Lending Credit Risk Analysis
+
+Every script reads its input and output locations from here. Defaults match
+the repository layout; override them with environment variables, with
+configure(), or with the global options of the p2p-credit-risk CLI (which
+call configure()):
+
+    P2P_ROOT         project root (default: the checkout when run from code/,
+                     otherwise the current working directory)
+    P2P_DATA_PATH    raw workbook (default: <root>/data/sentiment_scoring.25.12.30.xlsx)
+    P2P_PKL_DIR      preprocessed text-stage PKL files (default: /home/ubuntu/upload)
+    P2P_TABLES_DIR   generated tables (default: <root>/tables)
+    P2P_RESULTS_DIR  experiment results (default: <root>/results)
+
+The module attributes (ROOT, DATA_PATH, PKL_DIR, TABLES_DIR, RESULTS_DIR) are
+resolved on every use, so script constants built from them, e.g.
+OUTPUT_DIR = config.RESULTS_DIR / 'text_only_experiments', follow a
+configure() call made after the script was imported.
+"""
+
+import os
+from pathlib import Path
+
+# location name -> environment variable
+ENV_VARS = {
+    'root': 'P2P_ROOT',
+    'data_path': 'P2P_DATA_PATH',
+    'pkl_dir': 'P2P_PKL_DIR',
+    'tables_dir': 'P2P_TABLES_DIR',
+    'results_dir': 'P2P_RESULTS_DIR',
+}
+_ENV_AT_IMPORT = {env_name: os.environ.get(env_name) for env_name in ENV_VARS.values()}
+
+def _default_root():
+    """The repository checkout when running from code/, else the working directory"""
+    code_dir = Path(__file__).resolve().parent.parent
+    if code_dir.name == 'code' and (code_dir.parent / 'pyproject.toml').exists():
+        return code_dir.parent
+    return Path.cwd()  # installed copy: never resolve data paths into site-packages
+
+def location(name):
+    """Current value of one location ('root', 'data_path', 'pkl_dir', 'tables_dir', 'results_dir')"""
+    value = os.environ.get(ENV_VARS[name])
+    if value:
+        return Path(value)
+    if name == 'root':
+        return _default_root()
+    if name == 'pkl_dir':
+        return Path('/home/ubuntu/upload')
+
+    root = location('root')
+    return {
+        'data_path': root / 'data' / 'sentiment_scoring.25.12.30.xlsx',
+        'tables_dir': root / 'tables',
+        'results_dir': root / 'results',
+    }[name]
+
+def configure(**locations):
+    """
+    Move locations for this process and the worker processes it starts
+
+    Keyword names as in ENV_VARS. A value of None restores the location to
+    what the environment said when this module was first imported, so each
+    configure() call fully describes the overrides in effect.
+    """
+    for name, value in locations.items():
+        env_name = ENV_VARS[name]
+        if value is not None:
+            os.environ[env_name] = os.path.abspath(value)
+        elif _ENV_AT_IMPORT[env_name] is not None:
+            os.environ[env_name] = _ENV_AT_IMPORT[env_name]
+        else:
+            os.environ.pop(env_name, None)
+
+class ConfiguredPath(os.PathLike):
+    """
+    A path under a configured location, resolved on every use
+
+    Accepted wherever a path is (open, pandas, pathlib); Path attributes and
+    methods (name, exists(), mkdir(), glob(), ...) act on the resolved Path.
+    """
+
+    def __init__(self, name, *parts):
+        self._name = name
+        self._parts = parts
+
+    def resolved(self):
+        return location(self._name).joinpath(*self._parts)
+
+    def __fspath__(self):
+        return os.fspath(self.resolved())
+
+    def __truediv__(self, part):
+        return ConfiguredPath(self._name, *self._parts, part)
+
+    def __str__(self):
+        return str(self.resolved())
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __repr__(self):
+        return f"ConfiguredPath({self._name!r}) -> {self.resolved()}"
+
+    def __eq__(self, other):
+        if isinstance(other, ConfiguredPath):
+            other = other.resolved()
+        return self.resolved() == other
+
+    def __hash__(self):
+        return hash(self.resolved())
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return getattr(self.resolved(), attr)
+
+ROOT = ConfiguredPath('root')
+DATA_PATH = ConfiguredPath('data_path')
+PKL_DIR = ConfiguredPath('pkl_dir')
+TABLES_DIR = ConfiguredPath('tables_dir')
+RESULTS_DIR = ConfiguredPath('results_dir')
@@ -0,0 +1,244 @@
+"""
+Near-duplicate Detection over Loan Text Fields (MinHash + LSH)
+Korean P2P Lending Credit Risk Analysis
+
+Text fields: Title (제목), Loan Purpose (신청목적), Repayment Plan (상환계획)
+Output: duplicate cluster per loan row, for group-aware train/test splitting
+
+Each text is shingled into character n-grams and reduced to a MinHash
+signature (computed in parallel over chunks of texts). Signatures are cut
+into bands; texts sharing a band bucket become candidates, and candidates
+whose estimated Jaccard similarity reaches the threshold are linked. Each
+bucket only links its members to one representative, so the work grows
+with the number of texts rather than the number of pairs. Rows linked
+through any field form one cluster (connected components).
+
+Usage (group-aware text-only experiments):
+    python3 code/dedup_text_minhash.py
+    python3 code/experiment_text_only_complete_metrics.py --group-duplicates
+    python3 code/sweep_queue.py submit --queue /shared/sweep --sweep text --group-duplicates
+"""
+
+import argparse
+import os
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from . import config
+
+# Paths
+DATA_PATH = config.DATA_PATH
+OUTPUT_DIR = config.RESULTS_DIR / 'near_duplicates'
+CLUSTERS_PATH = OUTPUT_DIR / 'text_duplicate_clusters.csv'
+
+# Text fields: (English name, column name)
+TEXT_FIELDS = [
+    ('Title', '제목'),
+    ('Loan Purpose', '신청목적'),
+    ('Repayment Plan', '상환계획')
+]
+
+# MinHash / LSH settings
+SHINGLE_SIZE = 5        # characters per shingle
+NUM_PERM = 128          # signature length = BANDS * ROWS_PER_BAND
+BANDS = 16
+ROWS_PER_BAND = 8       # LSH threshold ~ (1/BANDS)^(1/ROWS_PER_BAND) = 0.71
+JACCARD_THRESHOLD = 0.8
+MIN_CHARS = 20          # shorter texts are too generic to call duplicates
+CHUNK_SIZE = 2000
+MINHASH_SEED = 42
+PRIME = np.uint64((1 << 31) - 1)
+
+def _permutations(num_perm=NUM_PERM, seed=MINHASH_SEED):
+    """Coefficients of the hash family h(x) = (a*x + b) mod PRIME"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(PRIME), num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(PRIME), num_perm, dtype=np.uint64)
+    return a[:, np.newaxis], b[:, np.newaxis]
+
+def normalize_text(text):
+    return ' '.join(str(text).lower().split())
+
+def shingle_hashes(text, n=SHINGLE_SIZE):
+    """Distinct character n-gram hashes of a text (uint64, reduced mod PRIME)"""
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    if len(codes) < n:
+        windows = codes[np.newaxis]
+        powers = np.uint64(1000003) ** np.arange(len(codes), dtype=np.uint64)
+    else:
+        windows = np.lib.stride_tricks.sliding_window_view(codes, n)
+        powers = np.uint64(1000003) ** np.arange(n, dtype=np.uint64)
+    hashes = (windows * powers).sum(axis=1)  # wraps mod 2^64
+    return np.unique((hashes ^ (hashes >> np.uint64(32))) % PRIME)
+
+def minhash_signatures(texts, num_perm=NUM_PERM):
+    """MinHash signatures for a list of (normalized, non-empty) texts"""
+    a, b = _permutations(num_perm)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    for i, text in enumerate(texts):
+        shingles = shingle_hashes(text)
+        signatures[i] = ((a * shingles + b) % PRIME).min(axis=1)
+    return signatures
+
+def parallel_signatures(texts, chunk_size=CHUNK_SIZE, n_workers=None):
+    """MinHash signatures computed over chunks of texts in a process pool"""
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    if len(chunks) <= 1:
+        return minhash_signatures(texts)
+
+    with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count()) as pool:
+        return np.vstack(list(pool.map(minhash_signatures, chunks)))
+
+def lsh_edges(signatures, bands=BANDS, rows_per_band=ROWS_PER_BAND, threshold=JACCARD_THRESHOLD):
+    """
+    Verified near-duplicate links between signatures
+
+    Returns:
+        (src, dst) index arrays of linked signature rows
+    """
+    src, dst = [], []
+    if len(signatures) < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    for band in range(bands):
+        block = signatures[:, band * rows_per_band:(band + 1) * rows_per_band]
+        _, bucket = np.unique(block, axis=0, return_inverse=True)
+        bucket = bucket.ravel()
+
+        # Link every bucket member to the bucket's first member
+        order = np.argsort(bucket, kind='stable')
+        sorted_bucket = bucket[order]
+        starts = np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]]
+        representative = order[np.flatnonzero(starts)[np.cumsum(starts) - 1]]
+        members = order[representative != order]
+        representative = representative[representative != order]
+
+        if len(members) == 0:
+            continue
+        similarity = (signatures[members] == signatures[representative]).mean(axis=1)
+        keep = similarity >= threshold
+        src.append(representative[keep])
+        dst.append(members[keep])
+
+    if not src:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(src), np.concatenate(dst)
+
+def find_duplicate_clusters(df, fields=TEXT_FIELDS, min_chars=MIN_CHARS, n_workers=None):
+    """
+    Cluster loan rows whose text fields are near-duplicates
+
+    Args:
+        df: DataFrame with the text columns
+        fields: (English name, column name) pairs to index
+
+    Returns:
+        DataFrame indexed like df with cluster_id, cluster_size and one
+        duplicate flag per field
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    n_rows = len(df)
+    row_src, row_dst = [], []
+    flags = {}
+
+    for eng_name, kor_name in fields:
+        texts = df[kor_name].fillna('').map(normalize_text)
+        rows = np.flatnonzero(texts.str.len().values >= min_chars)
+        print(f"  {eng_name}: {len(rows):,} texts")
+
+        signatures = parallel_signatures(texts.values[rows].tolist(), n_workers=n_workers)
+        src, dst = lsh_edges(signatures)
+        row_src.append(rows[src])
+        row_dst.append(rows[dst])
+
+        flag = np.zeros(n_rows, dtype=bool)
+        flag[rows[src]] = flag[rows[dst]] = True
+        flags[f"dup_{eng_name.lower().replace(' ', '_')}"] = flag
+        print(f"    near-duplicate rows: {flag.sum():,}")
+
+    src, dst = np.concatenate(row_src), np.concatenate(row_dst)
+    graph = coo_matrix((np.ones(len(src)), (src, dst)), shape=(n_rows, n_rows))
+    _, labels = connected_components(graph, directed=False)
+
+    clusters = pd.DataFrame({'cluster_id': labels}, index=df.index)
+    clusters['cluster_size'] = clusters.groupby('cluster_id')['cluster_id'].transform('size')
+    for name, flag in flags.items():
+        clusters[name] = flag
+    return clusters
+
+def load_clusters(path=CLUSTERS_PATH):
+    """Cluster id per workbook row (index = row_id)"""
+    return pd.read_csv(path, index_col='row_id')['cluster_id']
+
+def cluster_groups(row_ids, clusters=None):
+    """
+    Cluster id for each of the given workbook rows
+
+    Args:
+        row_ids: workbook row ids, e.g. the index kept by load_stage
+        clusters: cluster id per row_id (default: load_clusters())
+
+    Returns:
+        int array aligned with row_ids
+    """
+    clusters = load_clusters() if clusters is None else clusters
+    groups = clusters.reindex(row_ids)
+    if groups.isna().any():
+        missing = groups.index[groups.isna()][:5].tolist()
+        raise ValueError(f"{groups.isna().sum()} rows have no duplicate cluster (e.g. row_id {missing}); "
+                         f"re-run dedup_text_minhash.py on the workbook the PKL files were built from")
+    return groups.values.astype(np.int64)
+
+def group_train_test_split(X, y, groups, test_size=0.2, random_state=None):
+    """
+    Stratified train/test split that keeps each duplicate cluster on one side
+
+    Drop-in replacement for train_test_split(..., stratify=y); the test share
+    is approximately test_size (whole clusters move together).
+    """
+    from sklearn.model_selection import StratifiedGroupKFold
+
+    n_splits = int(round(1 / test_size))
+    splitter = StratifiedGroupKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    train_idx, test_idx = next(splitter.split(X, y, groups))
+    return X[train_idx], X[test_idx], y[train_idx], y[test_idx]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='MinHash/LSH near-duplicate detection over loan texts')
+    parser.add_argument('--input', type=Path, default=DATA_PATH)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    print("="*80)
+    print("Near-duplicate Detection: Loan Text Fields")
+    print("="*80)
+    print(f"Shingles: {SHINGLE_SIZE}-char, signatures: {NUM_PERM}, bands: {BANDS}x{ROWS_PER_BAND}")
+    print(f"Jaccard threshold: {JACCARD_THRESHOLD}")
+    print(f"Output: {OUTPUT_DIR}")
+    print("="*80)
+
+    df = pd.read_csv(args.input) if args.input.suffix == '.csv' else pd.read_excel(args.input)
+    print(f"Total samples: {len(df):,}")
+
+    clusters = find_duplicate_clusters(df, n_workers=args.workers)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    clusters.to_csv(CLUSTERS_PATH, index_label='row_id')
+
+    duplicated = clusters[clusters['cluster_size'] > 1]
+    print("\n" + "="*80)
+    print("Duplicate Clusters")
+    print("="*80)
+    print(f"Clusters with >1 row: {duplicated['cluster_id'].nunique():,}")
+    print(f"Rows in duplicate clusters: {len(duplicated):,} ({len(duplicated) / len(df) * 100:.2f}%)")
+    print(f"Largest cluster: {clusters['cluster_size'].max():,} rows")
+    print(f"\n✓ Clusters saved to: {CLUSTERS_PATH}")
+
+    return clusters
+
+if __name__ == '__main__':
+    clusters = main()
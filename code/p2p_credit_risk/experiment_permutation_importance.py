@@ -0,0 +1,250 @@
+"""
+Permutation Feature Importance for the Table 4-1 Models and Text-only Stages
+Korean P2P Lending Credit Risk Analysis
+
+Structured: 14 selected variables (Remove_Weak_14), Table 4-1 models
+Text-only: Logistic Regression on the Stage 1-4 PKL features
+Importance: drop in ROC-AUC when a feature is permuted, 20 repeats
+Iterations: 50 random seeds
+
+The repeats of one feature are stacked into as few predict_proba calls as
+MAX_BATCH_BYTES allows and scored with the batched ROC-AUC. Work is spread over (feature, seed) pairs in
+a process pool; pairs of the same seed are sent to a worker as one chunk, so
+each worker fits the seed's model once and reuses it for all its features.
+"""
+
+import argparse
+import multiprocessing
+import os
+import pickle
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import warnings
+
+from . import config
+from .generate_table_2_2_descriptive_statistics import VARIABLES
+from .experiment_threshold_analysis import PKL_FILES, batched_roc_auc
+from .experiment_text_only_complete_metrics import calculate_ci
+from .experiment_variable_selection import (
+    MODELS, RANDOM_SEEDS, load_structured_data, make_model, make_splits
+)
+
+# Paths
+OUTPUT_DIR = config.RESULTS_DIR / 'permutation_importance'
+
+# Experiment settings
+N_REPEATS = 20
+TEXT_MAX_FEATURES = 100  # text stages: highest-variance columns only
+MAX_BATCH_BYTES = 64 * 2**20  # size of the stacked repeats passed to predict_proba
+
+# Worker state (set once per process by _init_worker)
+_X = None
+_Y = None
+_SPLITS = None
+_FEATURES = None
+_MODEL_FACTORY = None
+_N_REPEATS = None
+_FITTED = {}
+
+def make_text_model(seed):
+    """Logistic Regression as in the text-only experiments"""
+    from sklearn.linear_model import LogisticRegression
+    return LogisticRegression(max_iter=1000, random_state=seed, class_weight='balanced')
+
+def permutation_aucs(model, X_test, y_test, columns, n_repeats, rng,
+                     max_batch_bytes=MAX_BATCH_BYTES):
+    """
+    ROC-AUC of the model with `columns` permuted, for all repeats
+
+    Repeats are stacked into (batch * n_test, n_features) matrices of at most
+    max_batch_bytes. The stacked buffer is allocated once per call and only
+    the permuted columns are rewritten for each repeat.
+
+    Returns:
+        array of n_repeats ROC-AUC values
+    """
+    n_test = len(y_test)
+    perm = rng.permuted(np.tile(np.arange(n_test), (n_repeats, 1)), axis=1)
+    batch = int(np.clip(max_batch_bytes // max(X_test.nbytes, 1), 1, n_repeats))
+
+    X_perm = np.tile(X_test, (batch, 1))
+    scores = np.empty((n_repeats, n_test))
+    for start in range(0, n_repeats, batch):
+        stop = min(start + batch, n_repeats)
+        for k, r in enumerate(range(start, stop)):
+            X_perm[k * n_test:(k + 1) * n_test, columns] = X_test[perm[r]][:, columns]
+        rows = (stop - start) * n_test
+        scores[start:stop] = model.predict_proba(X_perm[:rows])[:, 1].reshape(stop - start, n_test)
+
+    return batched_roc_auc(y_test, scores)
+
+def _init_worker(X, y, splits, features, model_factory, n_repeats):
+    global _X, _Y, _SPLITS, _FEATURES, _MODEL_FACTORY, _N_REPEATS
+    _X, _Y, _FEATURES = X, y, features
+    _SPLITS = {seed: (train_idx, test_idx) for seed, train_idx, test_idx in splits}
+    _MODEL_FACTORY, _N_REPEATS = model_factory, n_repeats
+
+def _fitted_model(seed):
+    """Fit the seed's model once per worker and keep it with its baseline AUC"""
+    if seed not in _FITTED:
+        _FITTED.clear()  # pairs arrive seed by seed; keep one model in memory
+        train_idx, test_idx = _SPLITS[seed]
+        model = _MODEL_FACTORY(seed)
+        model.fit(_X[train_idx], _Y[train_idx])
+        baseline = batched_roc_auc(_Y[test_idx], model.predict_proba(_X[test_idx])[:, 1])
+        _FITTED[seed] = (model, float(baseline))
+    return _FITTED[seed]
+
+def _evaluate_pair(pair):
+    """Permutation importance of one (seed, feature) pair"""
+    seed, feature_idx = pair
+    name, columns = _FEATURES[feature_idx]
+    model, baseline = _fitted_model(seed)
+    _, test_idx = _SPLITS[seed]
+
+    rng = np.random.default_rng([seed, feature_idx])
+    aucs = permutation_aucs(model, _X[test_idx], _Y[test_idx], columns, _N_REPEATS, rng)
+    drops = baseline - aucs
+
+    return {
+        'seed': seed,
+        'feature': name,
+        'baseline_roc_auc': baseline,
+        'importance_mean': float(drops.mean()),
+        'importance_std': float(drops.std(ddof=1)) if len(drops) > 1 else 0.0,
+    }
+
+def run_permutation_importance(X, y, features, model_factory, seeds=RANDOM_SEEDS,
+                               n_repeats=N_REPEATS, n_workers=None):
+    """
+    Permutation importance over (feature, seed) pairs in a process pool
+
+    Args:
+        X: feature matrix (ndarray)
+        y: binary target
+        features: list of (name, column indices) to permute jointly
+        model_factory: picklable callable seed -> unfitted model
+        seeds: random seeds for the train/test splits
+
+    Returns:
+        (per-seed DataFrame, summary DataFrame with mean and 95% CI)
+    """
+    splits = make_splits(y, seeds)
+    pairs = [(seed, i) for seed in seeds for i in range(len(features))]
+
+    state = (X, y, splits, features, model_factory, n_repeats)
+    if multiprocessing.get_start_method() == 'fork':
+        # forked workers share X copy-on-write instead of each unpickling a copy
+        _init_worker(*state)
+        pool_kwargs = {}
+    else:
+        pool_kwargs = {'initializer': _init_worker, 'initargs': state}
+
+    with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count(), **pool_kwargs) as pool:
+        details = pd.DataFrame(pool.map(_evaluate_pair, pairs, chunksize=len(features)))
+
+    summary = []
+    for name, _ in features:
+        values = details.loc[details['feature'] == name, 'importance_mean'].values
+        mean_val, ci_lower, ci_upper = calculate_ci(values)
+        summary.append({
+            'feature': name,
+            'importance_mean': mean_val,
+            'importance_ci_lower': ci_lower,
+            'importance_ci_upper': ci_upper,
+        })
+    summary = pd.DataFrame(summary).sort_values('importance_mean', ascending=False)
+
+    return details, summary
+
+def structured_features():
+    """(name, columns) for the 14 selected variables"""
+    return [(eng_name, [i]) for i, (eng_name, _) in enumerate(VARIABLES)]
+
+def text_features(X, feature_names=None, max_features=TEXT_MAX_FEATURES):
+    """(name, columns) for the highest-variance text feature columns"""
+    variances = X.var(axis=0)
+    top = np.sort(np.argsort(-variances, kind='stable')[:max_features])
+    if feature_names is None:
+        feature_names = [f'dim_{i}' for i in range(X.shape[1])]
+    return [(str(feature_names[i]), [int(i)]) for i in top]
+
+def save_results(details, summary, name):
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    details.to_csv(OUTPUT_DIR / f'{name}_importance_details.csv', index=False, encoding='utf-8-sig')
+    summary.to_csv(OUTPUT_DIR / f'{name}_importance.csv', index=False, encoding='utf-8-sig')
+
+    print(f"\n  Top features:")
+    for _, row in summary.head(10).iterrows():
+        print(f"    {row['feature']:<25} {row['importance_mean']:.4f} "
+              f"({row['importance_ci_lower']:.4f}, {row['importance_ci_upper']:.4f})")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Permutation feature importance')
+    parser.add_argument('--models', nargs='*', choices=MODELS, default=['GB', 'RF'])
+    parser.add_argument('--text', action='store_true', help='also run the text-only stages')
+    parser.add_argument('--seeds', type=int, default=len(RANDOM_SEEDS), help='number of seeds (1..N)')
+    parser.add_argument('--repeats', type=int, default=N_REPEATS)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+    warnings.filterwarnings('ignore')
+
+    seeds = list(range(1, args.seeds + 1))
+
+    print("="*80)
+    print("Permutation Feature Importance")
+    print("="*80)
+    print(f"Models: {', '.join(args.models)}")
+    print(f"Iterations: {len(seeds)}")
+    print(f"Repeats: {args.repeats}")
+    print(f"Output: {OUTPUT_DIR}")
+    print("="*80)
+
+    if args.models:
+        X_df, y = load_structured_data(VARIABLES)
+        X = X_df.values
+        features = structured_features()
+
+        for model in args.models:
+            print(f"\n{'='*80}")
+            print(f"{model}: {len(features)} variables x {len(seeds)} seeds")
+            print(f"{'='*80}")
+
+            details, summary = run_permutation_importance(
+                X, y, features, partial(make_model, model),
+                seeds=seeds, n_repeats=args.repeats, n_workers=args.workers,
+            )
+            save_results(details, summary, model.lower())
+
+    if args.text:
+        for stage_name, pkl_path in PKL_FILES.items():
+            if not pkl_path.exists():
+                print(f"\n⚠️  {stage_name} skipped: file not found")
+                continue
+
+            print(f"\n{'='*80}")
+            print(f"{stage_name}")
+            print(f"{'='*80}")
+
+            with open(pkl_path, 'rb') as f:
+                data = pickle.load(f)
+            X = np.vstack([data['X_train'], data['X_test']])
+            y = pd.concat([data['y_train'], data['y_test']]).values
+            features = text_features(X, data.get('feature_names'))
+
+            details, summary = run_permutation_importance(
+                X, y, features, make_text_model,
+                seeds=seeds, n_repeats=args.repeats, n_workers=args.workers,
+            )
+
+            stage_num = stage_name.split()[1]
+            stage_method = stage_name.split('(')[1].rstrip(')').lower().replace(' ', '_')
+            save_results(details, summary, f'stage{stage_num}_{stage_method}')
+
+    print(f"\n✓ Results saved to: {OUTPUT_DIR}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,275 @@
+"""
+Text-only Model Experiments with Complete Metrics (5 metrics)
+Korean P2P Lending Credit Risk Analysis
+
+Model: Logistic Regression
+Evaluation: ROC-AUC, PR-AUC, H-Measure, Recall, F1-Score with 95% CI
+Iterations: 50 random seeds
+"""
+
+import argparse
+import pickle
+import time
+import pandas as pd
+import numpy as np
+from datetime import datetime, timezone
+from pathlib import Path
+import warnings
+
+from . import config
+from .results_warehouse import long_results, save_run
+
+# Paths
+PKL_DIR = config.PKL_DIR
+OUTPUT_DIR = config.RESULTS_DIR / 'text_only_experiments'
+
+# PKL files mapping
+PKL_FILES = {
+    'Stage 1 (TF-IDF)': PKL_DIR / 'preprocessed_text_only_binary.pkl',
+    'Stage 2 (Subword)': PKL_DIR / 'preprocessed_text_subword_binary.pkl',
+    'Stage 3 (MiniLM)': PKL_DIR / 'preprocessed_text_minilm_binary.pkl',
+    'Stage 4 (KoSimCSE)': PKL_DIR / 'preprocessed_text_kosimcse_binary.pkl',
+}
+
+# Experiment settings
+RANDOM_SEEDS = list(range(1, 51))  # 50 iterations
+TEST_SIZE = 0.2
+
+def calculate_h_measure(y_true, y_pred_proba, c=0.5):
+    """
+    Calculate H-Measure
+    c: cost ratio (default 0.5 for balanced cost)
+    """
+    from sklearn.metrics import roc_curve
+    
+    # Get ROC curve
+    fpr, tpr, thresholds = roc_curve(y_true, y_pred_proba)
+    
+    # Calculate H-measure
+    # Simplified version: H = 1 - sqrt((FPR^2 + (1-TPR)^2) / 2)
+    # More accurate: weighted by cost
+    
+    # Find optimal threshold based on cost
+    costs = c * fpr + (1 - c) * (1 - tpr)
+    optimal_idx = np.argmin(costs)
+    
+    # H-measure at optimal threshold
+    h_measure = 1 - costs[optimal_idx]
+    
+    return h_measure
+
+def calculate_ci(values, confidence=0.95):
+    """Calculate mean and 95% CI"""
+    from scipy.stats import sem, t
+    
+    n = len(values)
+    mean_val = np.mean(values)
+    se_val = sem(values)
+    ci_margin = se_val * t.ppf((1 + confidence) / 2, n - 1)
+    return mean_val, mean_val - ci_margin, mean_val + ci_margin
+
+def load_stage(pkl_path):
+    """
+    Load a stage PKL file and return the full (train + test) dataset
+    
+    Returns:
+        X_full, y_full and the workbook row id of each row (the y index),
+        which aligns the rows with dedup_text_minhash.load_clusters()
+    """
+    print(f"Loading: {pkl_path.name}")
+    with open(pkl_path, 'rb') as f:
+        data = pickle.load(f)
+    
+    print(f"  Description: {data.get('description', 'N/A')}")
+    
+    # Get full dataset
+    X_full = np.vstack([data['X_train'], data['X_test']])
+    y_series = pd.concat([data['y_train'], data['y_test']])
+    
+    print(f"  Full dataset shape: {X_full.shape}")
+    return X_full, y_series.values, y_series.index.values
+
+def evaluate_seed(X_full, y_full, seed, groups=None):
+    """
+    Split, train and evaluate one seed with all 5 metrics
+    
+    groups: optional near-duplicate cluster per row (dedup_text_minhash);
+            when given, each cluster stays on one side of the split
+    """
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import roc_auc_score, recall_score, f1_score, average_precision_score
+    from sklearn.model_selection import train_test_split
+    
+    # Split
+    if groups is None:
+        X_train, X_test, y_train, y_test = train_test_split(
+            X_full, y_full, test_size=TEST_SIZE, random_state=seed, stratify=y_full
+        )
+    else:
+        from .dedup_text_minhash import group_train_test_split
+        X_train, X_test, y_train, y_test = group_train_test_split(
+            X_full, y_full, groups, test_size=TEST_SIZE, random_state=seed
+        )
+    
+    # Train
+    model = LogisticRegression(max_iter=1000, random_state=seed, class_weight='balanced')
+    model.fit(X_train, y_train)
+    
+    # Predict
+    y_pred_proba = model.predict_proba(X_test)[:, 1]
+    y_pred = model.predict(X_test)
+    
+    # Evaluate - 5 metrics
+    return {
+        'seed': seed,
+        'roc_auc': roc_auc_score(y_test, y_pred_proba),
+        'pr_auc': average_precision_score(y_test, y_pred_proba),
+        'h_measure': calculate_h_measure(y_test, y_pred_proba),
+        'recall': recall_score(y_test, y_pred),
+        'f1_score': f1_score(y_test, y_pred)
+    }
+
+def summarize_stage(stage_name, results_df):
+    """Mean and 95% CI of the 5 metrics over seeds"""
+    output = {'stage': stage_name}
+    
+    for metric in ['roc_auc', 'pr_auc', 'h_measure', 'recall', 'f1_score']:
+        values = results_df[metric].values
+        mean_val, ci_lower, ci_upper = calculate_ci(values)
+        output[f'{metric}_mean'] = mean_val
+        output[f'{metric}_ci_lower'] = ci_lower
+        output[f'{metric}_ci_upper'] = ci_upper
+    
+    print(f"\n  Results:")
+    print(f"    ROC-AUC:   {output['roc_auc_mean']:.4f} ({output['roc_auc_ci_lower']:.4f}, {output['roc_auc_ci_upper']:.4f})")
+    print(f"    PR-AUC:    {output['pr_auc_mean']:.4f} ({output['pr_auc_ci_lower']:.4f}, {output['pr_auc_ci_upper']:.4f})")
+    print(f"    H-Measure: {output['h_measure_mean']:.4f} ({output['h_measure_ci_lower']:.4f}, {output['h_measure_ci_upper']:.4f})")
+    print(f"    Recall:    {output['recall_mean']:.4f} ({output['recall_ci_lower']:.4f}, {output['recall_ci_upper']:.4f})")
+    print(f"    F1:        {output['f1_score_mean']:.4f} ({output['f1_score_ci_lower']:.4f}, {output['f1_score_ci_upper']:.4f})")
+    
+    return output
+
+def run_experiments(stage_name, pkl_path, seeds, group_duplicates=False):
+    """
+    Run experiments for a stage with all 5 metrics
+    
+    group_duplicates: keep near-duplicate text clusters (dedup_text_minhash)
+                      on one side of every split
+    """
+    print(f"\n{'='*80}")
+    print(f"{stage_name}")
+    print(f"{'='*80}")
+    
+    X_full, y_full, row_ids = load_stage(pkl_path)
+    groups = None
+    if group_duplicates:
+        from .dedup_text_minhash import cluster_groups
+        groups = cluster_groups(row_ids)
+        print(f"  Duplicate clusters: {len(np.unique(groups)):,} groups for {len(groups):,} rows")
+    
+    print(f"  Running {len(seeds)} iterations...")
+    
+    results = []
+    
+    for i, seed in enumerate(seeds, 1):
+        results.append(evaluate_seed(X_full, y_full, seed, groups))
+        
+        if i % 10 == 0:
+            print(f"    Completed {i}/{len(seeds)}...")
+    
+    # Calculate statistics
+    results_df = pd.DataFrame(results)
+    output = summarize_stage(stage_name, results_df)
+    
+    return output, results_df
+
+def experiment_name(group_duplicates=False):
+    """Warehouse experiment name of the complete-metrics runs"""
+    return 'text_only_complete_grouped' if group_duplicates else 'text_only_complete'
+
+def stage_results_path(stage_name, group_duplicates=False):
+    """Per-seed results file of a stage, e.g. stage1_tf-idf_complete_results.csv"""
+    stage_num = stage_name.split()[1]
+    stage_method = stage_name.split('(')[1].rstrip(')').lower().replace(' ', '_')
+    suffix = '_grouped' if group_duplicates else ''
+    return OUTPUT_DIR / f'stage{stage_num}_{stage_method}_complete{suffix}_results.csv'
+
+def save_summary(all_results, group_duplicates=False):
+    """Save and print the summary over stages"""
+    print("\n" + "="*80)
+    print("SUMMARY: Complete Metrics")
+    print("="*80)
+    
+    if all_results:
+        summary_df = pd.DataFrame(all_results)
+        suffix = '_grouped' if group_duplicates else ''
+        summary_df.to_csv(OUTPUT_DIR / f'text_only_complete_metrics{suffix}_summary.csv', index=False)
+        
+        print(f"\n{'Stage':<25} {'ROC-AUC':<15} {'PR-AUC':<15} {'H-Measure':<15} {'Recall':<15} {'F1':<15}")
+        print("-"*100)
+        
+        for _, row in summary_df.iterrows():
+            print(f"{row['stage']:<25} {row['roc_auc_mean']:<15.4f} {row['pr_auc_mean']:<15.4f} {row['h_measure_mean']:<15.4f} {row['recall_mean']:<15.4f} {row['f1_score_mean']:<15.4f}")
+        
+        print(f"\n✓ Results saved to: {OUTPUT_DIR}")
+    else:
+        print("\n❌ No experiments completed")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Text-only experiments with complete metrics (5 metrics)')
+    parser.add_argument('--group-duplicates', action='store_true',
+                        help='keep near-duplicate text clusters (dedup_text_minhash.py) on one side of each split')
+    args = parser.parse_args(argv)
+    warnings.filterwarnings('ignore')
+    
+    print("="*80)
+    print("Text-only Model Experiments: Complete Metrics (5 metrics)")
+    print("="*80)
+    print(f"PKL files directory: {PKL_DIR}")
+    print(f"Iterations: {len(RANDOM_SEEDS)}")
+    print(f"Metrics: ROC-AUC, PR-AUC, H-Measure, Recall, F1-Score")
+    print(f"Split: {'grouped by near-duplicate cluster' if args.group_duplicates else 'stratified'}")
+    print(f"Output: {OUTPUT_DIR}")
+    print("="*80)
+    
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    
+    # Run all stages
+    all_results = []
+    run_rows, run_sources, run_inputs = [], [], []
+    
+    for stage_name, pkl_path in PKL_FILES.items():
+        if not pkl_path.exists():
+            print(f"\n⚠️  {stage_name} skipped: file not found")
+            continue
+        
+        try:
+            output, details = run_experiments(stage_name, pkl_path, RANDOM_SEEDS,
+                                              group_duplicates=args.group_duplicates)
+            all_results.append(output)
+            
+            # Save individual results
+            details_path = stage_results_path(stage_name, args.group_duplicates)
+            details.to_csv(details_path, index=False)
+            run_rows.append(long_results(details, stage_name, 'LR'))
+            run_sources.append(details_path)
+            run_inputs.append(pkl_path)
+            
+        except Exception as e:
+            print(f"\n❌ Error in {stage_name}: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    save_summary(all_results, args.group_duplicates)
+    
+    if run_rows:
+        save_run(experiment_name(args.group_duplicates), pd.concat(run_rows), sources=run_sources,
+                 data_paths=run_inputs, started_at=started_at,
+                 elapsed_seconds=time.perf_counter() - start)
+    
+    return all_results
+
+if __name__ == '__main__':
+    all_results = main()
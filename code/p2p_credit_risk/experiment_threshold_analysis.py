@@ -0,0 +1,280 @@
+"""
+Threshold Analysis: Recall, Precision, F1, Expected Loss and Approval Rate Curves
+Korean P2P Lending Credit Risk Analysis
+
+Model: Logistic Regression (same setup as the text-only experiments)
+Evaluation: every distinct score threshold instead of the fixed 0.5 cutoff
+Iterations: 50 random seeds
+
+Recall and F1 in the text-only summaries come from model.predict(), which
+cuts at 0.5. Here the test-set scores of all seeds are stacked into one
+(n_seeds, n_test) array and each row is sorted once; cumulative sums over
+the sorted labels give TP/FP at every distinct threshold, so the curves for
+all seeds are computed in a single batched pass. The curve files store the
+confusion counts, so any operating point can be chosen later without a refit.
+"""
+
+import argparse
+import pickle
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import warnings
+
+from . import config
+from .experiment_text_only_complete_metrics import calculate_ci
+
+# Paths
+PKL_DIR = config.PKL_DIR
+OUTPUT_DIR = config.RESULTS_DIR / 'threshold_analysis'
+
+# PKL files mapping
+PKL_FILES = {
+    'Stage 1 (TF-IDF)': PKL_DIR / 'preprocessed_text_only_binary.pkl',
+    'Stage 2 (Subword)': PKL_DIR / 'preprocessed_text_subword_binary.pkl',
+    'Stage 3 (MiniLM)': PKL_DIR / 'preprocessed_text_minilm_binary.pkl',
+    'Stage 4 (KoSimCSE)': PKL_DIR / 'preprocessed_text_kosimcse_binary.pkl',
+}
+
+# Experiment settings
+RANDOM_SEEDS = list(range(1, 51))  # 50 iterations
+TEST_SIZE = 0.2
+
+# Cost settings (per application)
+# COST_DEFAULT: loss when a defaulter is approved (false negative)
+# COST_REPAYMENT: lost margin when a good borrower is rejected (false positive)
+COST_DEFAULT = 1.0
+COST_REPAYMENT = 0.2
+
+def batched_roc_auc(y_true, scores):
+    """
+    ROC-AUC for many score vectors at once (Mann-Whitney U on ranks)
+
+    Args:
+        y_true: binary labels, shape (n,) or (..., n)
+        scores: predicted scores, shape (..., n); y_true is broadcast
+
+    Returns:
+        array of ROC-AUC values with shape scores.shape[:-1]
+    """
+    from scipy.stats import rankdata
+
+    scores = np.asarray(scores, dtype=float)
+    y_true = np.broadcast_to(np.asarray(y_true).astype(bool), scores.shape)
+
+    ranks = rankdata(scores, axis=-1)
+    n_pos = y_true.sum(axis=-1)
+    n_neg = y_true.shape[-1] - n_pos
+    rank_sum = np.where(y_true, ranks, 0.0).sum(axis=-1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (rank_sum - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+
+def threshold_curves(y_true, scores, seeds, cost_default=COST_DEFAULT,
+                     cost_repayment=COST_REPAYMENT):
+    """
+    Evaluate every distinct threshold for a batch of seeds
+
+    A sample is predicted as default (1) when score >= threshold. The first
+    row of each seed has threshold=inf (approve everyone).
+
+    Args:
+        y_true: test labels, shape (n_seeds, n_test)
+        scores: test scores, shape (n_seeds, n_test)
+        seeds: seed of each row
+        cost_default: cost of approving a defaulter (FN)
+        cost_repayment: cost of rejecting a repayer (FP)
+
+    Returns:
+        DataFrame with one row per (seed, threshold)
+    """
+    y_true = np.asarray(y_true, dtype=np.int64)
+    scores = np.asarray(scores, dtype=float)
+    n_seeds, n_test = scores.shape
+
+    # Single descending sort per seed
+    order = np.argsort(-scores, axis=1, kind='mergesort')
+    s_sorted = np.take_along_axis(scores, order, axis=1)
+    y_sorted = np.take_along_axis(y_true, order, axis=1)
+
+    tp = np.cumsum(y_sorted, axis=1)
+    fp = np.arange(1, n_test + 1) - tp
+
+    # Keep the last position of each run of tied scores
+    distinct = np.ones_like(s_sorted, dtype=bool)
+    distinct[:, :-1] = s_sorted[:, :-1] != s_sorted[:, 1:]
+    rows, cols = np.nonzero(distinct)
+
+    # Prepend the approve-everyone point for each seed
+    start = np.arange(n_seeds)
+    thresholds = np.concatenate([np.full(n_seeds, np.inf), s_sorted[rows, cols]])
+    tp = np.concatenate([np.zeros(n_seeds, dtype=np.int64), tp[rows, cols]])
+    fp = np.concatenate([np.zeros(n_seeds, dtype=np.int64), fp[rows, cols]])
+    rows = np.concatenate([start, rows])
+
+    # Group by seed, thresholds descending within each seed
+    keep = np.argsort(rows, kind='stable')
+    rows, thresholds, tp, fp = rows[keep], thresholds[keep], tp[keep], fp[keep]
+
+    n_pos = y_true.sum(axis=1)[rows]
+    fn = n_pos - tp
+    predicted_pos = tp + fp
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        recall = np.where(n_pos > 0, tp / n_pos, 0.0)
+        precision = np.where(predicted_pos > 0, tp / predicted_pos, 0.0)
+        f1 = np.where(n_pos + predicted_pos > 0, 2 * tp / (n_pos + predicted_pos), 0.0)
+
+    return pd.DataFrame({
+        'seed': np.asarray(seeds)[rows],
+        'threshold': thresholds,
+        'tp': tp,
+        'fp': fp,
+        'recall': recall,
+        'precision': precision,
+        'f1_score': f1,
+        'expected_loss': (cost_default * fn + cost_repayment * fp) / n_test,
+        'approval_rate': (n_test - predicted_pos) / n_test,
+    })
+
+def select_operating_points(curves):
+    """Pick the max-F1 and min-expected-loss thresholds for each seed"""
+    best_f1 = curves.loc[curves.groupby('seed')['f1_score'].idxmax()]
+    best_loss = curves.loc[curves.groupby('seed')['expected_loss'].idxmin()]
+    return best_f1.reset_index(drop=True), best_loss.reset_index(drop=True)
+
+def collect_scores(pkl_path, seeds):
+    """Fit one model per seed and stack the test labels and scores"""
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.model_selection import train_test_split
+
+    print(f"Loading: {pkl_path.name}")
+    with open(pkl_path, 'rb') as f:
+        data = pickle.load(f)
+
+    X_full = np.vstack([data['X_train'], data['X_test']])
+    y_full = pd.concat([data['y_train'], data['y_test']]).values
+
+    print(f"  Full dataset shape: {X_full.shape}")
+    print(f"  Running {len(seeds)} iterations...")
+
+    y_rows, score_rows = [], []
+
+    for i, seed in enumerate(seeds, 1):
+        X_train, X_test, y_train, y_test = train_test_split(
+            X_full, y_full, test_size=TEST_SIZE, random_state=seed, stratify=y_full
+        )
+
+        model = LogisticRegression(max_iter=1000, random_state=seed, class_weight='balanced')
+        model.fit(X_train, y_train)
+
+        y_rows.append(y_test)
+        score_rows.append(model.predict_proba(X_test)[:, 1])
+
+        if i % 10 == 0:
+            print(f"    Completed {i}/{len(seeds)}...")
+
+    return np.vstack(y_rows), np.vstack(score_rows)
+
+def run_threshold_analysis(stage_name, pkl_path, seeds, cost_default=COST_DEFAULT,
+                           cost_repayment=COST_REPAYMENT):
+    """Compute threshold curves and operating points for a stage"""
+    print(f"\n{'='*80}")
+    print(f"{stage_name}")
+    print(f"{'='*80}")
+
+    y_test, scores = collect_scores(pkl_path, seeds)
+
+    curves = threshold_curves(y_test, scores, seeds, cost_default, cost_repayment)
+    roc_auc = batched_roc_auc(y_test, scores)
+    best_f1, best_loss = select_operating_points(curves)
+
+    output = {'stage': stage_name}
+
+    mean_val, ci_lower, ci_upper = calculate_ci(roc_auc)
+    output['roc_auc_mean'] = mean_val
+    output['roc_auc_ci_lower'] = ci_lower
+    output['roc_auc_ci_upper'] = ci_upper
+
+    for prefix, points in [('max_f1', best_f1), ('min_loss', best_loss)]:
+        for metric in ['threshold', 'recall', 'f1_score', 'expected_loss', 'approval_rate']:
+            mean_val, ci_lower, ci_upper = calculate_ci(points[metric].values)
+            output[f'{prefix}_{metric}_mean'] = mean_val
+            output[f'{prefix}_{metric}_ci_lower'] = ci_lower
+            output[f'{prefix}_{metric}_ci_upper'] = ci_upper
+
+    print(f"\n  Curve points: {len(curves):,} ({len(curves) / len(seeds):.0f} per seed)")
+    print(f"  Max-F1 operating point:")
+    print(f"    Threshold: {output['max_f1_threshold_mean']:.4f}")
+    print(f"    Recall:    {output['max_f1_recall_mean']:.4f}")
+    print(f"    F1:        {output['max_f1_f1_score_mean']:.4f}")
+    print(f"  Min-expected-loss operating point:")
+    print(f"    Threshold:     {output['min_loss_threshold_mean']:.4f}")
+    print(f"    Expected loss: {output['min_loss_expected_loss_mean']:.4f}")
+    print(f"    Approval rate: {output['min_loss_approval_rate_mean']:.4f}")
+
+    return output, curves
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Threshold, cost and approval-rate curves for the text-only stages')
+    parser.add_argument('--cost-default', type=float, default=COST_DEFAULT, help='cost of approving a defaulter')
+    parser.add_argument('--cost-repayment', type=float, default=COST_REPAYMENT, help='cost of rejecting a repayer')
+    args = parser.parse_args(argv)
+    warnings.filterwarnings('ignore')
+
+    print("="*80)
+    print("Threshold Analysis: Text-only Stages 1-4")
+    print("="*80)
+    print(f"PKL files directory: {PKL_DIR}")
+    print(f"Iterations: {len(RANDOM_SEEDS)}")
+    print(f"Costs: default={args.cost_default}, repayment={args.cost_repayment}")
+    print(f"Output: {OUTPUT_DIR}")
+    print("="*80)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    all_results = []
+
+    for stage_name, pkl_path in PKL_FILES.items():
+        if not pkl_path.exists():
+            print(f"\n⚠️  {stage_name} skipped: file not found")
+            continue
+
+        try:
+            output, curves = run_threshold_analysis(stage_name, pkl_path, RANDOM_SEEDS,
+                                                   args.cost_default, args.cost_repayment)
+            all_results.append(output)
+
+            stage_num = stage_name.split()[1]
+            stage_method = stage_name.split('(')[1].rstrip(')').lower().replace(' ', '_')
+            curves.to_csv(OUTPUT_DIR / f'stage{stage_num}_{stage_method}_threshold_curves.csv.gz',
+                          index=False)
+
+        except Exception as e:
+            print(f"\n❌ Error in {stage_name}: {e}")
+            import traceback
+            traceback.print_exc()
+
+    print("\n" + "="*80)
+    print("SUMMARY: Operating Points")
+    print("="*80)
+
+    if all_results:
+        summary_df = pd.DataFrame(all_results)
+        summary_df.to_csv(OUTPUT_DIR / 'threshold_analysis_summary.csv', index=False)
+
+        print(f"\n{'Stage':<25} {'ROC-AUC':<10} {'Max-F1 Recall':<15} {'Max-F1 F1':<12} {'Min Loss':<10}")
+        print("-"*75)
+
+        for _, row in summary_df.iterrows():
+            print(f"{row['stage']:<25} {row['roc_auc_mean']:<10.4f} {row['max_f1_recall_mean']:<15.4f} "
+                  f"{row['max_f1_f1_score_mean']:<12.4f} {row['min_loss_expected_loss_mean']:<10.4f}")
+
+        print(f"\n✓ Results saved to: {OUTPUT_DIR}")
+    else:
+        print("\n❌ No experiments completed")
+
+    return all_results
+
+if __name__ == '__main__':
+    all_results = main()
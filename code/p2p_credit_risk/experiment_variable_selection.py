@@ -0,0 +1,344 @@
+"""
+Variable Subset Search: Forward, Backward and Beam Search over Structured Variables
+Korean P2P Lending Credit Risk Analysis
+
+Candidates: 14 selected variables (Table 2-2) + 3 removed variables (17 total)
+Evaluation: mean ROC-AUC with 95% CI over 50 random seeds
+Reproduces the variable_combination experiment behind Remove_Weak_14
+
+Every evaluated subset is memoized under a canonical key (column names in
+candidate order), so no subset is fit twice within a run even when several
+search paths reach it. Seed splits are computed once and shared with the
+worker processes through the pool initializer; candidate subsets of each
+search step are evaluated in parallel.
+"""
+
+import argparse
+import os
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import warnings
+
+from . import config
+from .generate_table_2_2_descriptive_statistics import VARIABLES
+from .experiment_threshold_analysis import batched_roc_auc
+from .experiment_text_only_complete_metrics import calculate_ci
+
+# Paths
+DATA_PATH = config.DATA_PATH
+OUTPUT_DIR = config.RESULTS_DIR / 'variable_selection'
+
+# Variables removed from the original 17 (see README)
+REMOVED_VARIABLES = [
+    ('Gender', '성별'),
+    ('Loan Term', '신청기간'),
+    ('Months of Service', '서비스이용개월수')
+]
+CANDIDATE_VARIABLES = VARIABLES + REMOVED_VARIABLES
+
+# Experiment settings
+RANDOM_SEEDS = list(range(1, 51))  # 50 iterations
+TEST_SIZE = 0.2
+DEFAULT_MODEL = 'GB'
+DEFAULT_BEAM_WIDTH = 3
+
+# Worker state (set once per process by _init_worker)
+_X = None
+_Y = None
+_SPLITS = None
+_MODEL = None
+
+def make_model(model, seed):
+    """Create an unfitted model by its Table 4-1 abbreviation"""
+    from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.naive_bayes import GaussianNB
+    from sklearn.neighbors import KNeighborsClassifier
+    from sklearn.neural_network import MLPClassifier
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.svm import SVC
+    from sklearn.tree import DecisionTreeClassifier
+
+    if model == 'GB':
+        return GradientBoostingClassifier(random_state=seed)
+    if model == 'RF':
+        return RandomForestClassifier(n_estimators=100, random_state=seed, n_jobs=1)
+    if model == 'LR':
+        return make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000, random_state=seed))
+    if model == 'NB':
+        return GaussianNB()
+    if model == 'SVM':
+        return make_pipeline(StandardScaler(), SVC(probability=True, random_state=seed))
+    if model == 'DT':
+        return DecisionTreeClassifier(random_state=seed)
+    if model == 'MLP':
+        return make_pipeline(StandardScaler(), MLPClassifier(max_iter=500, random_state=seed))
+    if model == 'KNN':
+        return make_pipeline(StandardScaler(), KNeighborsClassifier())
+    if model == 'XGB':
+        from xgboost import XGBClassifier
+        return XGBClassifier(random_state=seed, n_jobs=1, eval_metric='logloss')
+    raise ValueError(f"Unknown model: {model}")
+
+# Table 4-1 models
+MODELS = ['LR', 'NB', 'SVM', 'DT', 'RF', 'GB', 'XGB', 'MLP', 'KNN']
+
+def load_structured_data(variables=CANDIDATE_VARIABLES):
+    """
+    Load the candidate variables and binary target
+
+    Non-numeric columns are integer-coded and missing values are filled
+    with the column median so every subset sees the same rows.
+
+    Returns:
+        X (DataFrame with column names), y (ndarray)
+    """
+    df = pd.read_excel(DATA_PATH)
+    y = (df['상환결과'] == '채무불이행').astype(int).values
+
+    columns = [kor_name for _, kor_name in variables]
+    X = df[columns].copy()
+    for col in columns:
+        if not pd.api.types.is_numeric_dtype(X[col]):
+            X[col] = pd.Series(pd.factorize(X[col])[0], index=X.index).replace(-1, np.nan)
+        X[col] = X[col].fillna(X[col].median()).astype(float)
+
+    return X, y
+
+def evaluate_model_seed(model_name, X, y, seed, test_size=TEST_SIZE):
+    """
+    Train and evaluate one model on one seed split (Table 4-1 raw schema)
+
+    Returns:
+        dict with Model, Seed, ROC_AUC, PR_AUC, H_Measure, Recall, F1_Score
+    """
+    from sklearn.metrics import roc_auc_score, recall_score, f1_score, average_precision_score
+    from sklearn.model_selection import train_test_split
+    from .experiment_text_only_complete_metrics import calculate_h_measure
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=seed, stratify=y
+    )
+
+    model = make_model(model_name, seed)
+    model.fit(X_train, y_train)
+
+    y_pred_proba = model.predict_proba(X_test)[:, 1]
+    y_pred = model.predict(X_test)
+
+    return {
+        'Model': model_name,
+        'Seed': seed,
+        'ROC_AUC': roc_auc_score(y_test, y_pred_proba),
+        'PR_AUC': average_precision_score(y_test, y_pred_proba),
+        'H_Measure': calculate_h_measure(y_test, y_pred_proba),
+        'Recall': recall_score(y_test, y_pred),
+        'F1_Score': f1_score(y_test, y_pred)
+    }
+
+def make_splits(y, seeds, test_size=TEST_SIZE):
+    """Stratified train/test indices for every seed (shared by all subsets)"""
+    from sklearn.model_selection import train_test_split
+
+    indices = np.arange(len(y))
+    splits = []
+    for seed in seeds:
+        train_idx, test_idx = train_test_split(
+            indices, test_size=test_size, random_state=seed, stratify=y
+        )
+        splits.append((seed, train_idx, test_idx))
+    return splits
+
+def subset_key(columns, candidates=CANDIDATE_VARIABLES):
+    """Canonical key for a subset: its columns in candidate order"""
+    order = {kor_name: i for i, (_, kor_name) in enumerate(candidates)}
+    return tuple(sorted(set(columns), key=order.__getitem__))
+
+def english_names(columns, candidates=CANDIDATE_VARIABLES):
+    """Semicolon-joined English names of workbook columns, as in Table 2-2"""
+    names = {kor_name: eng_name for eng_name, kor_name in candidates}
+    return ';'.join(names.get(c, c) for c in columns)
+
+def _init_worker(X, y, splits, model):
+    global _X, _Y, _SPLITS, _MODEL
+    _X, _Y, _SPLITS, _MODEL = X, y, splits, model
+
+def _evaluate_subset(key):
+    """Fit one model per seed on the subset and return per-seed ROC-AUC"""
+    X_sub = _X[list(key)].values
+    y_rows, score_rows = [], []
+
+    for seed, train_idx, test_idx in _SPLITS:
+        model = make_model(_MODEL, seed)
+        model.fit(X_sub[train_idx], _Y[train_idx])
+        y_rows.append(_Y[test_idx])
+        score_rows.append(model.predict_proba(X_sub[test_idx])[:, 1])
+
+    return key, batched_roc_auc(np.vstack(y_rows), np.vstack(score_rows))
+
+class SubsetSearch:
+    """
+    Memoized, parallel evaluator shared by the search strategies
+
+    Args:
+        X: DataFrame of candidate columns
+        y: binary target
+        seeds: random seeds for the shared splits
+        model: model abbreviation (one of MODELS)
+        n_workers: number of worker processes (default: all cores)
+    """
+
+    def __init__(self, X, y, seeds=RANDOM_SEEDS, model=DEFAULT_MODEL, n_workers=None):
+        self.columns = list(X.columns)
+        self.seeds = list(seeds)
+        self.model = model
+        self.cache = {}
+        self.n_workers = n_workers or os.cpu_count()
+
+        splits = make_splits(y, self.seeds)
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_init_worker,
+            initargs=(X, y, splits, model),
+        )
+
+    def close(self):
+        self.pool.shutdown()
+
+    def score(self, key):
+        return float(np.mean(self.cache[key]))
+
+    def evaluate(self, subsets):
+        """Evaluate subsets not yet in the cache; return their mean ROC-AUC"""
+        keys = list(dict.fromkeys(subset_key(s) for s in subsets))
+        todo = [key for key in keys if key not in self.cache]
+
+        for key, aucs in self.pool.map(_evaluate_subset, todo):
+            self.cache[key] = aucs
+
+        return {key: self.score(key) for key in keys}
+
+    def forward(self):
+        """Greedy forward selection from the empty set"""
+        current, path = (), []
+        while len(current) < len(self.columns):
+            remaining = [c for c in self.columns if c not in current]
+            scores = self.evaluate([current + (c,) for c in remaining])
+            current = max(scores, key=scores.get)
+            path.append(current)
+            print(f"    Forward  {len(current):>2} vars: ROC-AUC {scores[current]:.4f}")
+        return path
+
+    def backward(self):
+        """Greedy backward elimination from the full set"""
+        current = subset_key(self.columns)
+        self.evaluate([current])
+        path = [current]
+        print(f"    Backward {len(current):>2} vars: ROC-AUC {self.score(current):.4f}")
+        while len(current) > 1:
+            scores = self.evaluate([tuple(c for c in current if c != drop) for drop in current])
+            current = max(scores, key=scores.get)
+            path.append(current)
+            print(f"    Backward {len(current):>2} vars: ROC-AUC {scores[current]:.4f}")
+        return path
+
+    def beam(self, width=DEFAULT_BEAM_WIDTH):
+        """Beam search: keep the best `width` subsets of each size"""
+        beam, path = [()], []
+        while len(beam[0]) < len(self.columns):
+            candidates = [b + (c,) for b in beam for c in self.columns if c not in b]
+            scores = self.evaluate(candidates)
+            beam = sorted(scores, key=scores.get, reverse=True)[:width]
+            path.append(beam[0])
+            print(f"    Beam     {len(beam[0]):>2} vars: ROC-AUC {scores[beam[0]]:.4f}")
+        return path
+
+    def results_frame(self):
+        """All evaluated subsets with mean ROC-AUC and 95% CI"""
+        rows = []
+        for key, aucs in self.cache.items():
+            mean_val, ci_lower, ci_upper = calculate_ci(aucs)
+            dropped = [c for c in self.columns if c not in key]
+            rows.append({
+                'n_variables': len(key),
+                'variables': english_names(key),
+                'removed': english_names(dropped),
+                'roc_auc_mean': mean_val,
+                'roc_auc_ci_lower': ci_lower,
+                'roc_auc_ci_upper': ci_upper,
+            })
+        return pd.DataFrame(rows).sort_values('roc_auc_mean', ascending=False)
+
+def run_search(method, model=DEFAULT_MODEL, beam_width=DEFAULT_BEAM_WIDTH,
+               seeds=RANDOM_SEEDS, n_workers=None):
+    """Run one search strategy and return (path DataFrame, evaluated DataFrame)"""
+    X, y = load_structured_data()
+    print(f"Total samples: {len(y):,}")
+    print(f"Candidate variables: {X.shape[1]}")
+
+    search = SubsetSearch(X, y, seeds=seeds, model=model, n_workers=n_workers)
+    try:
+        if method == 'forward':
+            path = search.forward()
+        elif method == 'backward':
+            path = search.backward()
+        elif method == 'beam':
+            path = search.beam(beam_width)
+        else:
+            raise ValueError(f"Unknown search method: {method}")
+    finally:
+        search.close()
+
+    path_df = pd.DataFrame([
+        {'step': i, 'n_variables': len(key), 'variables': english_names(key),
+         'roc_auc_mean': search.score(key)}
+        for i, key in enumerate(path, 1)
+    ])
+    print(f"\n  Subsets evaluated: {len(search.cache)}")
+    return path_df, search.results_frame()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Variable subset search over the structured variables')
+    parser.add_argument('--method', choices=['forward', 'backward', 'beam'], default='backward')
+    parser.add_argument('--model', choices=MODELS, default=DEFAULT_MODEL)
+    parser.add_argument('--beam-width', type=int, default=DEFAULT_BEAM_WIDTH)
+    parser.add_argument('--seeds', type=int, default=len(RANDOM_SEEDS), help='number of seeds (1..N)')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+    warnings.filterwarnings('ignore')
+
+    seeds = list(range(1, args.seeds + 1))
+
+    print("="*80)
+    print(f"Variable Subset Search: {args.method} ({args.model})")
+    print("="*80)
+    print(f"Iterations: {len(seeds)}")
+    print(f"Output: {OUTPUT_DIR}")
+    print("="*80)
+
+    path_df, evaluated_df = run_search(
+        args.method, model=args.model, beam_width=args.beam_width,
+        seeds=seeds, n_workers=args.workers,
+    )
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    prefix = f'{args.method}_{args.model.lower()}_{len(seeds)}iterations'
+    path_df.to_csv(OUTPUT_DIR / f'{prefix}_path.csv', index=False, encoding='utf-8-sig')
+    evaluated_df.to_csv(OUTPUT_DIR / f'{prefix}_evaluated.csv', index=False, encoding='utf-8-sig')
+
+    best = evaluated_df.iloc[0]
+    print("\n" + "="*80)
+    print("Best Subset")
+    print("="*80)
+    print(f"Variables ({best['n_variables']}): {best['variables']}")
+    print(f"Removed: {best['removed'] or '-'}")
+    print(f"ROC-AUC: {best['roc_auc_mean']:.4f} ({best['roc_auc_ci_lower']:.4f}, {best['roc_auc_ci_upper']:.4f})")
+    print(f"\n✓ Results saved to: {OUTPUT_DIR}")
+
+    return path_df, evaluated_df
+
+if __name__ == '__main__':
+    path_df, evaluated_df = main()
@@ -0,0 +1,134 @@
+"""
+Generate Table 2-1: Distribution of Repayment Outcomes (2-Class) and Binary Target Composition
+Korean P2P Lending Credit Risk Analysis
+
+The counts per 상환결과 are kept in a persisted state, so a batch of new
+loan rows can be folded in with refresh_repayment_distribution() without
+re-reading the whole workbook.
+"""
+
+import pandas as pd
+
+from . import config
+from .table_state import STATE_DIR, load_state, save_state, batch_digest
+
+# Paths
+DATA_PATH = config.DATA_PATH
+OUTPUT_PATH = config.TABLES_DIR / 'table_2_1_repayment_distribution.csv'
+STATE_PATH = STATE_DIR / 'table_2_1_state.json'
+
+def new_state():
+    return {'n_rows': 0, 'outcome_counts': {}, 'applied_batches': []}
+
+def update_state(state, df):
+    """Fold loan rows into the state (counts per 상환결과)"""
+    counts = df['상환결과'].fillna('NaN').astype(str).value_counts()
+    for outcome, count in counts.items():
+        state['outcome_counts'][outcome] = state['outcome_counts'].get(outcome, 0) + int(count)
+    state['n_rows'] += len(df)
+    return state
+
+def table_from_state(state):
+    """Build the Table 2-1 DataFrame from the state"""
+    total = state['n_rows']
+    default_count = state['outcome_counts'].get('채무불이행', 0)
+    repayment_count = total - default_count
+
+    table_data = [
+        {
+            'Repayment Outcome': 'Default',
+            'Number': default_count,
+            'Ratio (%)': round(default_count / total * 100, 2),
+            'y (target)': 1
+        },
+        {
+            'Repayment Outcome': 'Repayment',
+            'Number': repayment_count,
+            'Ratio (%)': round(repayment_count / total * 100, 2),
+            'y (target)': 0
+        },
+        {
+            'Repayment Outcome': 'Total',
+            'Number': total,
+            'Ratio (%)': 100.00,
+            'y (target)': ''
+        }
+    ]
+
+    return pd.DataFrame(table_data)
+
+def save_table(table_df):
+    """Save Table 2-1 and print it with the additional statistics"""
+    total = table_df.iloc[2]['Number']
+    default_count = table_df.iloc[0]['Number']
+    repayment_count = table_df.iloc[1]['Number']
+
+    # Save to CSV
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    table_df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
+
+    print("\n" + "="*80)
+    print("Table 2-1: Repayment Outcome Distribution")
+    print("="*80)
+    print(table_df.to_string(index=False))
+
+    print("\n" + "="*80)
+    print("Additional Statistics")
+    print("="*80)
+    print(f"Imbalance Ratio: {repayment_count / default_count:.2f}:1")
+    print(f"Default Rate: {default_count / total * 100:.2f}%")
+    print(f"Repayment Rate: {repayment_count / total * 100:.2f}%")
+
+    print("\n" + "="*80)
+    print(f"Table saved to: {OUTPUT_PATH}")
+    print("="*80)
+
+def generate_repayment_distribution():
+    """Generate repayment outcome distribution table (full rebuild of the state)"""
+
+    print("="*80)
+    print("Table 2-1: Distribution of Repayment Outcomes (2-Class)")
+    print("="*80)
+
+    # Load data
+    df = pd.read_excel(DATA_PATH)
+    print(f"Total samples: {len(df):,}")
+
+    state = update_state(new_state(), df)
+    save_state(state, STATE_PATH)
+
+    table_df = table_from_state(state)
+    save_table(table_df)
+
+    return table_df
+
+def refresh_repayment_distribution(batch_df):
+    """
+    Fold a batch of new loan rows into the saved state and re-emit the table
+
+    Args:
+        batch_df: DataFrame with the workbook columns (only new rows)
+
+    Returns:
+        updated table DataFrame
+    """
+    state = load_state(STATE_PATH)
+    if state is None:
+        raise FileNotFoundError(f"No state at {STATE_PATH}; run generate_repayment_distribution() first")
+
+    digest = batch_digest(batch_df)
+    if digest in state['applied_batches']:
+        print(f"Table 2-1: batch already applied ({len(batch_df):,} rows), skipped")
+    else:
+        update_state(state, batch_df)
+        state['applied_batches'].append(digest)
+        save_state(state, STATE_PATH)
+        print(f"Table 2-1: folded {len(batch_df):,} new rows (total {state['n_rows']:,})")
+
+    table_df = table_from_state(state)
+    save_table(table_df)
+
+    return table_df
+
+if __name__ == '__main__':
+    table_df = generate_repayment_distribution()
@@ -0,0 +1,138 @@
+"""
+Generate Table 2-2: Descriptive Statistics for 14 Selected Variables
+Korean P2P Lending Credit Risk Analysis
+
+Moments, min/max and a quantile sketch per variable are kept in a persisted
+state, so a batch of new loan rows can be folded in with
+refresh_descriptive_statistics() without re-reading the whole workbook.
+"""
+
+import pandas as pd
+
+from . import config
+from .table_state import STATE_DIR, VariableSketch, load_state, save_state, batch_digest
+
+# Paths
+DATA_PATH = config.DATA_PATH
+OUTPUT_PATH = config.TABLES_DIR / 'table_2_2_descriptive_statistics.csv'
+STATE_PATH = STATE_DIR / 'table_2_2_state.json'
+
+# 14 selected variables (Remove_Weak_14): (English name, column name)
+VARIABLES = [
+    ('Loan Period', '대출시기'),
+    ('Cancel Count', '취소횟수'),
+    ('Fail Count', '실패횟수'),
+    ('Success Count', '성공횟수'),
+    ('Total Count', '총횟수'),
+    ('Success Rate', '성공률'),
+    ('Region', '지역(수도권0)'),
+    ('Age', '나이'),
+    ('Credit Score', '신용평점'),
+    ('Monthly Income', '월소득(만원)'),
+    ('Loan Amount', '신청금액(만원)'),
+    ('Loan Interest Rate', '신청금리'),
+    ('Monthly DTI', '월DTI'),
+    ('Number of Investors', '투자인원')
+]
+
+def new_state():
+    return {
+        'n_rows': 0,
+        'variables': {kor_name: VariableSketch().to_dict() for _, kor_name in VARIABLES},
+        'applied_batches': []
+    }
+
+def update_state(state, df):
+    """Fold loan rows into the per-variable sketches"""
+    for _, kor_name in VARIABLES:
+        sketch = VariableSketch.from_dict(state['variables'][kor_name])
+        sketch.update(df[kor_name].values)
+        state['variables'][kor_name] = sketch.to_dict()
+    state['n_rows'] += len(df)
+    return state
+
+def table_from_state(state):
+    """Build the Table 2-2 DataFrame from the state"""
+    stats_list = []
+
+    for eng_name, kor_name in VARIABLES:
+        data = VariableSketch.from_dict(state['variables'][kor_name])
+
+        stats = {
+            'Variable': eng_name,
+            'Mean': round(data.mean, 2),
+            'Standard Deviation': round(data.std(), 2),
+            'Median': round(data.quantile(0.5), 1),
+            'Q1': round(data.quantile(0.25), 1),
+            'Q3': round(data.quantile(0.75), 1),
+            'Min': round(data.min, 1),
+            'Max': round(data.max, 1)
+        }
+
+        stats_list.append(stats)
+
+    return pd.DataFrame(stats_list)
+
+def save_table(stats_df):
+    """Save Table 2-2 and print it"""
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    stats_df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
+
+    print("\n" + "="*80)
+    print("Descriptive Statistics Summary")
+    print("="*80)
+    print(stats_df.to_string(index=False))
+
+    print("\n" + "="*80)
+    print(f"Table saved to: {OUTPUT_PATH}")
+    print("="*80)
+
+def generate_descriptive_statistics():
+    """Generate descriptive statistics table for 14 selected variables (full rebuild of the state)"""
+
+    print("="*80)
+    print("Table 2-2: Descriptive Statistics for 14 Variables")
+    print("="*80)
+
+    # Load data
+    df = pd.read_excel(DATA_PATH)
+    print(f"Total samples: {len(df):,}")
+
+    state = update_state(new_state(), df)
+    save_state(state, STATE_PATH)
+
+    stats_df = table_from_state(state)
+    save_table(stats_df)
+
+    return stats_df
+
+def refresh_descriptive_statistics(batch_df):
+    """
+    Fold a batch of new loan rows into the saved state and re-emit the table
+
+    Args:
+        batch_df: DataFrame with the workbook columns (only new rows)
+
+    Returns:
+        updated table DataFrame
+    """
+    state = load_state(STATE_PATH)
+    if state is None:
+        raise FileNotFoundError(f"No state at {STATE_PATH}; run generate_descriptive_statistics() first")
+
+    digest = batch_digest(batch_df)
+    if digest in state['applied_batches']:
+        print(f"Table 2-2: batch already applied ({len(batch_df):,} rows), skipped")
+    else:
+        update_state(state, batch_df)
+        state['applied_batches'].append(digest)
+        save_state(state, STATE_PATH)
+        print(f"Table 2-2: folded {len(batch_df):,} new rows (total {state['n_rows']:,})")
+
+    stats_df = table_from_state(state)
+    save_table(stats_df)
+
+    return stats_df
+
+if __name__ == '__main__':
+    stats_df = generate_descriptive_statistics()
@@ -0,0 +1,153 @@
+"""
+Generate Table 2-3: Descriptive Statistics for Text Length (Number of Characters)
+Korean P2P Lending Credit Risk Analysis
+
+Moments, min/max and a quantile sketch per text field are kept in a
+persisted state, so a batch of new loan rows can be folded in with
+refresh_text_statistics() without re-reading the whole workbook.
+"""
+
+import pandas as pd
+
+from . import config
+from .table_state import STATE_DIR, VariableSketch, load_state, save_state, batch_digest
+
+# Paths
+DATA_PATH = config.DATA_PATH
+OUTPUT_PATH = config.TABLES_DIR / 'table_2_3_text_statistics.csv'
+STATE_PATH = STATE_DIR / 'table_2_3_state.json'
+
+# Fields: (display name, length column)
+FIELDS = [
+    ('Title', 'title_length'),
+    ('Loan Purpose', 'purpose_length'),
+    ('Repayment Plan', 'plan_length'),
+    ('Total (Title + Purpose + Plan)', 'total_length')
+]
+
+def text_lengths(df):
+    """Character lengths of the three text fields and their total"""
+    lengths = pd.DataFrame(index=df.index)
+    lengths['title_length'] = df['제목'].fillna('').astype(str).str.len()
+    lengths['purpose_length'] = df['신청목적'].fillna('').astype(str).str.len()
+    lengths['plan_length'] = df['상환계획'].fillna('').astype(str).str.len()
+    lengths['total_length'] = lengths['title_length'] + lengths['purpose_length'] + lengths['plan_length']
+    return lengths
+
+def new_state():
+    return {
+        'n_rows': 0,
+        'n_empty': 0,  # rows with no text in any field
+        'fields': {col_name: VariableSketch().to_dict() for _, col_name in FIELDS},
+        'applied_batches': []
+    }
+
+def update_state(state, df):
+    """Fold loan rows into the per-field length sketches"""
+    lengths = text_lengths(df)
+    for _, col_name in FIELDS:
+        sketch = VariableSketch.from_dict(state['fields'][col_name])
+        sketch.update(lengths[col_name].values)
+        state['fields'][col_name] = sketch.to_dict()
+    state['n_empty'] += int((lengths['total_length'] == 0).sum())
+    state['n_rows'] += len(df)
+    return state
+
+def table_from_state(state):
+    """Build the Table 2-3 DataFrame from the state"""
+    stats_list = []
+
+    for field_name, col_name in FIELDS:
+        data = VariableSketch.from_dict(state['fields'][col_name])
+
+        stats = {
+            'Field': field_name,
+            'Mean': round(data.mean, 1),
+            'Standard Deviation': round(data.std(), 1),
+            'Median': round(data.quantile(0.5), 1),
+            'Q1': round(data.quantile(0.25), 1),
+            'Q3': round(data.quantile(0.75), 1),
+            'Min': int(data.min),
+            'Max': int(data.max)
+        }
+
+        stats_list.append(stats)
+
+    return pd.DataFrame(stats_list)
+
+def save_table(stats_df, state):
+    """Save Table 2-3 and print it with the additional statistics"""
+    total = VariableSketch.from_dict(state['fields']['total_length'])
+    no_text = state['n_empty']
+
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    stats_df.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
+
+    print("\n" + "="*80)
+    print("Text Length Statistics Summary")
+    print("="*80)
+    print(stats_df.to_string(index=False))
+
+    print("\n" + "="*80)
+    print("Additional Statistics")
+    print("="*80)
+    print(f"Average total text length: {total.mean:.1f} characters")
+    print(f"Median total text length: {total.quantile(0.5):.1f} characters")
+    print(f"Samples with no text: {no_text:,}")
+    print(f"Samples with text: {total.n - no_text:,}")
+
+    print("\n" + "="*80)
+    print(f"Table saved to: {OUTPUT_PATH}")
+    print("="*80)
+
+def generate_text_statistics():
+    """Generate text length statistics table (full rebuild of the state)"""
+
+    print("="*80)
+    print("Table 2-3: Descriptive Statistics for Text Length")
+    print("="*80)
+
+    # Load data
+    df = pd.read_excel(DATA_PATH)
+    print(f"Total samples: {len(df):,}")
+
+    state = update_state(new_state(), df)
+    save_state(state, STATE_PATH)
+
+    stats_df = table_from_state(state)
+    save_table(stats_df, state)
+
+    return stats_df
+
+def refresh_text_statistics(batch_df):
+    """
+    Fold a batch of new loan rows into the saved state and re-emit the table
+
+    Args:
+        batch_df: DataFrame with the workbook columns (only new rows)
+
+    Returns:
+        updated table DataFrame
+    """
+    state = load_state(STATE_PATH)
+    if state is None:
+        raise FileNotFoundError(f"No state at {STATE_PATH}; run generate_text_statistics() first")
+    if 'n_empty' not in state:
+        raise ValueError(f"State at {STATE_PATH} has no empty-text count; run generate_text_statistics() to rebuild it")
+
+    digest = batch_digest(batch_df)
+    if digest in state['applied_batches']:
+        print(f"Table 2-3: batch already applied ({len(batch_df):,} rows), skipped")
+    else:
+        update_state(state, batch_df)
+        state['applied_batches'].append(digest)
+        save_state(state, STATE_PATH)
+        print(f"Table 2-3: folded {len(batch_df):,} new rows (total {state['n_rows']:,})")
+
+    stats_df = table_from_state(state)
+    save_table(stats_df, state)
+
+    return stats_df
+
+if __name__ == '__main__':
+    stats_df = generate_text_statistics()
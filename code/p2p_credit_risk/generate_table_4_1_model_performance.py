@@ -0,0 +1,133 @@
+"""
+Generate Table 4-1: Model Performance Comparison with 95% Confidence Intervals
+Korean P2P Lending Credit Risk Analysis
+
+Format: Mean (CI Lower, CI Upper)
+Based on 50-iteration experiments with Remove_Weak_14 variable set
+"""
+
+import pandas as pd
+
+from . import config
+from . import results_warehouse
+
+# Paths
+OUTPUT_PATH = config.TABLES_DIR / 'table_4_1_model_performance.csv'
+
+def generate_model_performance_table_with_ci(variable_set='Remove_Weak_14'):
+    """
+    Generate model performance comparison table with 95% CI
+    
+    Args:
+        variable_set: variable set of the structured runs in the results warehouse
+    """
+    
+    print("="*80)
+    print("Table 4-1: Model Performance Comparison with 95% Confidence Intervals")
+    print("="*80)
+    
+    # Mean and CI per model of the latest structured run, from the per-seed results
+    print("\nLoading 50-iteration experiment results from the results warehouse...")
+    conn = results_warehouse.connect()
+    results_warehouse.ingest_results_dir(conn)
+    per_seed = results_warehouse.latest_results(conn, 'structured')
+    summary_df = results_warehouse.stage_summary(conn, 'structured')
+    conn.close()
+    
+    per_seed = per_seed[per_seed['stage'] == variable_set]
+    summary_df = summary_df[summary_df['stage'] == variable_set]
+    if summary_df.empty:
+        raise ValueError(f"No structured results for {variable_set}; run sweep_queue.py assemble "
+                         f"or results_warehouse.py ingest first")
+    
+    print(f"Total experiments: {per_seed[['model', 'seed']].drop_duplicates().shape[0]}")
+    print(f"Models: {summary_df['model'].tolist()}")
+    print(f"Seeds: {per_seed['seed'].nunique()}")
+    
+    # Model name mapping
+    model_names = {
+        'LR': 'Logistic Regression (LR)',
+        'NB': 'Naive Bayes (NB)',
+        'SVM': 'Support Vector Machine (SVM)',
+        'DT': 'Decision Tree (DT)',
+        'RF': 'Random Forest (RF)',
+        'GB': 'Gradient Boosting (GB)',
+        'XGB': 'XGBoost (XGB)',
+        'MLP': 'Multi-Layer Perceptron (MLP)',
+        'KNN': 'K-Nearest Neighbors (KNN)'
+    }
+    
+    # Metrics to calculate
+    metrics = ['ROC_AUC', 'PR_AUC', 'H_Measure', 'Recall', 'F1_Score']
+    
+    # Format mean and CI for each model
+    results = []
+    
+    for _, model_row in summary_df.iterrows():
+        row = {'Model': model_names.get(model_row['model'], model_row['model'])}
+        
+        for metric in metrics:
+            key = metric.lower()
+            mean = model_row[f'{key}_mean']
+            ci_lower, ci_upper = model_row[f'{key}_ci_lower'], model_row[f'{key}_ci_upper']
+            
+            # Format: Mean (CI Lower, CI Upper)
+            metric_name = metric.replace('_', '-')
+            
+            row[metric_name] = f"{mean:.4f} ({ci_lower:.4f}, {ci_upper:.4f})"
+            row[f'{metric_name}_mean'] = mean  # For sorting
+        
+        results.append(row)
+    
+    # Create DataFrame
+    performance_df = pd.DataFrame(results)
+    
+    # Sort by ROC-AUC mean (descending)
+    performance_df = performance_df.sort_values('ROC-AUC_mean', ascending=False)
+    
+    # Drop mean columns (used only for sorting)
+    mean_cols = [col for col in performance_df.columns if col.endswith('_mean')]
+    performance_df_display = performance_df.drop(columns=mean_cols)
+    
+    # Save to CSV
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    performance_df_display.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
+    
+    print("\n" + "="*80)
+    print("Model Performance Summary (Mean and 95% CI)")
+    print("="*80)
+    print(performance_df_display.to_string(index=False))
+    
+    print("\n" + "="*80)
+    print("Key Findings")
+    print("="*80)
+    best_model = performance_df.iloc[0]['Model']
+    print(f"Best Model (ROC-AUC): {best_model}")
+    print(f"  ROC-AUC: {performance_df.iloc[0]['ROC-AUC']}")
+    print(f"  PR-AUC: {performance_df.iloc[0]['PR-AUC']}")
+    
+    print("\n" + "="*80)
+    print("Experimental Setup")
+    print("="*80)
+    print("Variables: 14 selected variables (Remove_Weak_14)")
+    print("Iterations: 50 random seeds")
+    print("Evaluation: Mean and 95% confidence interval")
+    print("CI Method: t-distribution (n=50)")
+    print("Metrics: ROC-AUC (primary), PR-AUC, H-Measure, Recall, F1-Score")
+    print("Data: 6,057 samples (55.34% default, 44.66% repayment)")
+    
+    print("\n" + "="*80)
+    print("Table Format")
+    print("="*80)
+    print("Format: Mean (CI Lower, CI Upper)")
+    print("Example: 0.8198 (0.8175, 0.8221)")
+    print("Note: Values are mean and 95% confidence interval from 50 iterations")
+    
+    print("\n" + "="*80)
+    print(f"Table saved to: {OUTPUT_PATH}")
+    print("="*80)
+    
+    return performance_df_display
+
+if __name__ == '__main__':
+    performance_df = generate_model_performance_table_with_ci()
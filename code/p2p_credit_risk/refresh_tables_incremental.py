@@ -0,0 +1,50 @@
+"""
+Incremental Refresh of Tables 2-1, 2-2 and 2-3
+Korean P2P Lending Credit Risk Analysis
+
+Folds a batch of newly appended loan rows (xlsx or csv with the workbook
+columns) into the persisted table states and re-emits the three CSVs.
+The cost depends only on the batch size. Run the generate_table_2_*
+scripts once beforehand to build the states from the full workbook.
+
+Usage:
+    python3 code/refresh_tables_incremental.py new_loans.xlsx
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+
+from .generate_table_2_1_repayment_distribution import refresh_repayment_distribution
+from .generate_table_2_2_descriptive_statistics import refresh_descriptive_statistics
+from .generate_table_2_3_text_statistics import refresh_text_statistics
+
+def read_batch(path):
+    """Read a batch of new loan rows"""
+    path = Path(path)
+    if path.suffix == '.csv':
+        return pd.read_csv(path)
+    return pd.read_excel(path)
+
+def refresh_tables(batch_df):
+    """Fold one batch into all three table states"""
+    return (
+        refresh_repayment_distribution(batch_df),
+        refresh_descriptive_statistics(batch_df),
+        refresh_text_statistics(batch_df),
+    )
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(__doc__)
+        sys.exit(1)
+
+    for batch_path in argv:
+        print("="*80)
+        print(f"Incremental refresh: {batch_path}")
+        print("="*80)
+        refresh_tables(read_batch(batch_path))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,366 @@
+"""
+Local Results Warehouse (SQLite)
+Korean P2P Lending Credit Risk Analysis
+
+Per-seed results of every experiment run, with run metadata, in one
+embedded SQLite file. The table generators read their inputs from here
+instead of the per-stage CSVs, and runs can be compared with plain SQL.
+
+Schema:
+    runs         one row per experiment run (or ingested legacy CSV):
+                 experiment, code version, data hash, host, start time, elapsed
+    run_sources  CSV files written by (or ingested into) a run, by content hash,
+                 so re-ingesting an unchanged file is a no-op
+    results      long format: (run_id, stage, model, seed, metric) -> value
+
+Stages are the text stage names ('Stage 1 (TF-IDF)', ...) or the variable
+set of the structured experiments ('Remove_Weak_14'). Metric names are
+normalized to roc_auc, pr_auc, h_measure, recall, f1_score.
+
+Usage:
+    python3 code/results_warehouse.py ingest             # results/ CSVs
+    python3 code/results_warehouse.py runs
+    python3 code/results_warehouse.py history --experiment text_only_complete --metric roc_auc
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import socket
+import sqlite3
+import subprocess
+import pandas as pd
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import config
+
+# Paths
+DB_PATH = config.RESULTS_DIR / 'results_warehouse.sqlite'
+TEXT_RESULTS_DIR = config.RESULTS_DIR / 'text_only_experiments'
+STRUCTURED_RESULTS_DIR = config.RESULTS_DIR / 'structured_experiments'
+
+# Text stages by number, as named by the experiment scripts
+STAGE_NAMES = {
+    1: 'Stage 1 (TF-IDF)',
+    2: 'Stage 2 (Subword)',
+    3: 'Stage 3 (MiniLM)',
+    4: 'Stage 4 (KoSimCSE)',
+}
+TEXT_MODEL = 'LR'
+
+METRICS = ['roc_auc', 'pr_auc', 'h_measure', 'recall', 'f1_score']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id          INTEGER PRIMARY KEY,
+    experiment      TEXT NOT NULL,
+    code_version    TEXT,
+    data_hash       TEXT,
+    host            TEXT,
+    started_at      TEXT,
+    elapsed_seconds REAL
+);
+CREATE TABLE IF NOT EXISTS run_sources (
+    sha256  TEXT PRIMARY KEY,
+    run_id  INTEGER NOT NULL REFERENCES runs(run_id),
+    path    TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id  INTEGER NOT NULL REFERENCES runs(run_id),
+    stage   TEXT NOT NULL,
+    model   TEXT NOT NULL,
+    seed    INTEGER NOT NULL,
+    metric  TEXT NOT NULL,
+    value   REAL,
+    PRIMARY KEY (run_id, stage, model, seed, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_by_stage ON results (stage, model, metric, run_id);
+CREATE INDEX IF NOT EXISTS runs_by_experiment ON runs (experiment, run_id);
+"""
+
+def connect(db_path=DB_PATH):
+    """Open (and create if needed) the warehouse"""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def code_version():
+    """git describe of the checkout this code runs from (None outside a git checkout)"""
+    try:
+        out = subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=Path(__file__).resolve().parent,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+def file_digest(paths):
+    """SHA-256 over the contents of one or more files"""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+def long_results(per_seed_df, stage, model, seed_col='seed'):
+    """Melt a wide per-seed frame (seed + metric columns) into warehouse rows"""
+    df = per_seed_df.rename(columns=lambda c: c if c == seed_col else c.lower())
+    metrics = [m for m in METRICS if m in df.columns]
+    long_df = df.melt(id_vars=[seed_col], value_vars=metrics, var_name='metric')
+    long_df = long_df.rename(columns={seed_col: 'seed'})
+    long_df.insert(0, 'stage', stage)
+    long_df.insert(1, 'model', model)
+    return long_df
+
+def record_run(conn, experiment, results, sources=(), data_paths=(), started_at=None,
+               elapsed_seconds=None, host=None, version=None, legacy=False):
+    """
+    Store one run
+
+    Args:
+        conn: warehouse connection
+        experiment: experiment name, e.g. 'text_only_complete'
+        results: long DataFrame with stage, model, seed, metric, value
+        sources: CSV files written by the run (skipped by later ingests)
+        data_paths: input files hashed into data_hash
+        started_at: datetime of the run start (default: now)
+        elapsed_seconds: wall time of the run
+        host: host(s) that ran it (default: this host)
+        version: code version(s) that ran it (default: git describe of this checkout)
+        legacy: results predate the warehouse; code version and host are unknown
+
+    Returns:
+        run_id
+    """
+    # stored in UTC so runs sort by start time as text
+    started_at = (started_at or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    data_paths = [p for p in data_paths if Path(p).exists()]
+
+    with conn:
+        cur = conn.execute(
+            'INSERT INTO runs (experiment, code_version, data_hash, host, started_at, elapsed_seconds) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (experiment, None if legacy else version or code_version(),
+             file_digest(data_paths) if data_paths else None,
+             None if legacy else host or socket.gethostname(),
+             started_at.isoformat(timespec='seconds'),
+             None if elapsed_seconds is None else float(elapsed_seconds)),
+        )
+        run_id = cur.lastrowid
+        conn.executemany(
+            'INSERT INTO results (run_id, stage, model, seed, metric, value) VALUES (?, ?, ?, ?, ?, ?)',
+            ((run_id, r.stage, r.model, int(r.seed), r.metric, float(r.value))
+             for r in results.itertuples(index=False)),
+        )
+        conn.executemany(
+            'INSERT OR REPLACE INTO run_sources (sha256, run_id, path) VALUES (?, ?, ?)',
+            ((file_digest(p), run_id, str(p)) for p in sources),
+        )
+    return run_id
+
+def recorded_run(conn, sources):
+    """run_id that already holds every one of the source files (by content), else None"""
+    run_ids = set()
+    for path in sources:
+        row = conn.execute('SELECT run_id FROM run_sources WHERE sha256 = ?', (file_digest(path),)).fetchone()
+        if row is None:
+            return None
+        run_ids.add(row[0])
+    return run_ids.pop() if len(run_ids) == 1 else None
+
+def save_run(experiment, results, db_path=DB_PATH, skip_recorded=False, **kwargs):
+    """
+    Record a finished run in the warehouse file (see record_run for kwargs)
+
+    skip_recorded: if every source file is already held by one run (e.g. the
+    same sweep assembled twice), return that run instead of a duplicate
+    """
+    conn = connect(db_path)
+    try:
+        run_id = recorded_run(conn, kwargs.get('sources', ())) if skip_recorded else None
+        if run_id is not None:
+            print(f"✓ Already recorded as run {run_id} in: {db_path}")
+            return run_id
+        run_id = record_run(conn, experiment, results, **kwargs)
+    finally:
+        conn.close()
+    print(f"✓ Recorded as run {run_id} in: {db_path}")
+    return run_id
+
+def _parse_text_results(path):
+    """(experiment, stage) of a per-seed text-stage CSV, from its file name"""
+    match = re.fullmatch(r'stage(\d)_(.+?)(_complete)?(_grouped)?_results\.csv', path.name)
+    if match is None or int(match.group(1)) not in STAGE_NAMES:
+        return None, None
+    stage = STAGE_NAMES[int(match.group(1))]
+
+    if match.group(3):
+        return 'text_only_complete' + (match.group(4) or ''), stage
+
+    # the V2 script writes e.g. stage1_tf-idf_results.csv; other spellings
+    # (stage1_tfidf_results.csv) come from earlier versions of the script
+    v2_method = stage.split('(')[1].rstrip(')').lower().replace(' ', '_')
+    if match.group(2) == v2_method:
+        return 'text_only_v2', stage
+    return 'text_only_legacy', stage
+
+def ingest_csv(conn, path):
+    """
+    Ingest one per-seed results CSV (text stage or structured)
+
+    Returns:
+        run_id, or None if the file was already ingested or is not per-seed
+    """
+    path = Path(path)
+    if conn.execute('SELECT 1 FROM run_sources WHERE sha256 = ?', (file_digest(path),)).fetchone():
+        return None
+
+    df = pd.read_csv(path)
+    if {'Variable_Set', 'Model', 'Seed'} <= set(df.columns):
+        experiment = 'structured'
+        results = pd.concat([
+            long_results(group.drop(columns=['Variable_Set', 'Model']), variable_set, model,
+                         seed_col='Seed')
+            for (variable_set, model), group in df.groupby(['Variable_Set', 'Model'], sort=False)
+        ])
+    else:
+        experiment, stage = _parse_text_results(path)
+        if experiment is None or 'seed' not in df.columns:
+            return None
+        results = long_results(df, stage, TEXT_MODEL)
+
+    mtime = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+    return record_run(conn, experiment, results, sources=[path], started_at=mtime, legacy=True)
+
+def ingest_results_dir(conn, text_dir=TEXT_RESULTS_DIR, structured_dir=STRUCTURED_RESULTS_DIR):
+    """
+    Ingest every per-seed CSV not yet in the warehouse
+
+    Files written by recorded runs are already known by hash, so this only
+    picks up results produced elsewhere or before the warehouse existed.
+    Summary CSVs are derived from the per-seed files and are skipped.
+    """
+    paths = sorted(Path(text_dir).glob('stage*_results.csv')) + sorted(Path(structured_dir).glob('*.csv'))
+    run_ids = []
+    for path in paths:
+        run_id = ingest_csv(conn, path)
+        if run_id is not None:
+            print(f"  Ingested {path.name} as run {run_id}")
+            run_ids.append(run_id)
+    return run_ids
+
+def latest_results(conn, experiment, model=None):
+    """
+    Per-seed results of the latest run of an experiment, per (stage, model)
+
+    Latest by start time (run_id only breaks ties), so an old CSV ingested
+    after a newer run does not replace it. Chosen per model, so a partial
+    run (e.g. a sweep whose XGB jobs failed) only replaces the models it
+    actually contains.
+
+    Returns:
+        long DataFrame with run_id, stage, model, seed, metric, value
+    """
+    query = """
+        WITH candidates AS (
+            SELECT DISTINCT res.stage, res.model, res.run_id, runs.started_at
+            FROM runs JOIN results res USING (run_id)
+            WHERE runs.experiment = :experiment AND (:model IS NULL OR res.model = :model)
+        ), latest AS (
+            SELECT stage, model, run_id,
+                   ROW_NUMBER() OVER (PARTITION BY stage, model
+                                      ORDER BY started_at DESC, run_id DESC) AS recency
+            FROM candidates
+        )
+        SELECT res.run_id, res.stage, res.model, res.seed, res.metric, res.value
+        FROM latest JOIN results res USING (stage, model, run_id)
+        WHERE latest.recency = 1
+        ORDER BY res.stage, res.model, res.metric, res.seed
+    """
+    return pd.read_sql_query(query, conn, params={'experiment': experiment, 'model': model})
+
+def stage_summary(conn, experiment, model=None):
+    """
+    Mean, 95% CI and range over seeds of the latest run per (stage, model)
+
+    Returns:
+        one row per (stage, model) with {metric}_mean, {metric}_ci_lower,
+        {metric}_ci_upper and {metric}_range columns, as the summary CSVs
+    """
+    from .experiment_text_only_complete_metrics import calculate_ci
+
+    per_seed = latest_results(conn, experiment, model)
+    rows = []
+    for (stage, model_name), group in per_seed.groupby(['stage', 'model'], sort=False):
+        row = {'stage': stage, 'model': model_name, 'run_id': group['run_id'].iloc[0]}
+        for metric in [m for m in METRICS if m in set(group['metric'])]:
+            values = group.loc[group['metric'] == metric, 'value'].values
+            mean_val, ci_lower, ci_upper = calculate_ci(values)
+            row[f'{metric}_mean'] = mean_val
+            row[f'{metric}_ci_lower'] = ci_lower
+            row[f'{metric}_ci_upper'] = ci_upper
+            row[f'{metric}_range'] = f"{values.min():.2f}-{values.max():.2f}"
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+def run_history(conn, experiment, metric):
+    """Mean, min, max and seed count of one metric for every run of an experiment"""
+    query = """
+        SELECT runs.run_id, runs.started_at, runs.code_version, runs.data_hash, runs.host,
+               res.stage, res.model, COUNT(*) AS n_seeds, AVG(res.value) AS mean,
+               MIN(res.value) AS min, MAX(res.value) AS max
+        FROM runs JOIN results res USING (run_id)
+        WHERE runs.experiment = ? AND res.metric = ?
+        GROUP BY runs.run_id, res.stage, res.model
+        ORDER BY res.stage, res.model, runs.started_at, runs.run_id
+    """
+    return pd.read_sql_query(query, conn, params=(experiment, metric))
+
+def list_runs(conn):
+    query = """
+        SELECT runs.*, COUNT(DISTINCT res.stage || '/' || res.model) AS n_stages,
+               COUNT(DISTINCT res.seed) AS n_seeds
+        FROM runs LEFT JOIN results res USING (run_id)
+        GROUP BY runs.run_id
+        ORDER BY runs.run_id
+    """
+    return pd.read_sql_query(query, conn)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local SQLite warehouse of per-seed experiment results')
+    parser.add_argument('--db', type=Path, default=DB_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('ingest', help='ingest per-seed CSVs (default: everything under results/)')
+    p.add_argument('paths', nargs='*', type=Path)
+
+    sub.add_parser('runs', help='list runs')
+
+    p = sub.add_parser('history', help='one metric across all runs of an experiment')
+    p.add_argument('--experiment', default='text_only_complete')
+    p.add_argument('--metric', default='roc_auc', choices=METRICS)
+
+    args = parser.parse_args(argv)
+    conn = connect(args.db)
+
+    if args.command == 'ingest':
+        if args.paths:
+            run_ids = [r for r in (ingest_csv(conn, p) for p in args.paths) if r is not None]
+        else:
+            run_ids = ingest_results_dir(conn)
+        print(f"✓ {len(run_ids)} new runs in {args.db}")
+    elif args.command == 'runs':
+        print(list_runs(conn).to_string(index=False))
+    elif args.command == 'history':
+        print(run_history(conn, args.experiment, args.metric).to_string(index=False))
+
+    conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,428 @@
+"""
+Multi-node Sweep Execution through a Shared-Filesystem Job Queue
+Korean P2P Lending Credit Risk Analysis
+
+Sweeps: text-only stages (4 stages x 50 seeds), Table 4-1 models (9 models x 50 seeds)
+No broker: any number of hosts that mount the same queue directory can run workers.
+
+Queue layout:
+    pending/   job specs waiting to be claimed
+    running/   claimed jobs; the file mtime is the worker's lease heartbeat
+    done/      finished job specs
+    failed/    jobs that exceeded MAX_ATTEMPTS
+    results/   one JSON result per job
+
+A worker claims a job with an atomic rename pending/ -> running/ (only one
+rename can succeed), touches it while the job runs, writes the result with
+write-then-rename and moves the spec to done/. Jobs whose lease is older
+than the timeout (dead or stuck workers) are renamed back to pending/ by
+whichever worker or coordinator notices first. Results are deterministic
+per (stage/model, seed), so a job that runs twice just rewrites its result.
+
+Usage:
+    python3 code/sweep_queue.py submit   --queue /shared/sweep --sweep all
+    python3 code/sweep_queue.py worker   --queue /shared/sweep      # on every node
+    python3 code/sweep_queue.py assemble --queue /shared/sweep
+    python3 code/sweep_queue.py local    --queue /tmp/sweep --workers 4
+"""
+
+import argparse
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+import warnings
+import pandas as pd
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import config
+
+# Paths
+STRUCTURED_OUTPUT_DIR = config.RESULTS_DIR / 'structured_experiments'
+
+# Queue settings
+LEASE_TIMEOUT = 600   # seconds without heartbeat before a job is requeued
+POLL_INTERVAL = 2     # seconds between claims when the queue is empty
+MAX_ATTEMPTS = 3
+SUBDIRS = ['pending', 'running', 'done', 'failed', 'results']
+
+# Datasets loaded by this worker process, keyed by stage name / 'structured'
+_DATA_CACHE = {}
+
+def _atomic_write_json(obj, path):
+    tmp_path = path.with_name(f'.{path.name}.{uuid.uuid4().hex}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def init_queue(queue_dir):
+    queue_dir = Path(queue_dir)
+    for sub in SUBDIRS:
+        (queue_dir / sub).mkdir(parents=True, exist_ok=True)
+    return queue_dir
+
+def sweep_jobs(sweep, seeds=None, group_duplicates=False):
+    """
+    Job specs for the 'text', 'structured' or 'all' sweep
+
+    group_duplicates: text jobs split by near-duplicate cluster (dedup_text_minhash)
+    """
+    from .experiment_text_only_complete_metrics import PKL_FILES, RANDOM_SEEDS
+    from .experiment_variable_selection import MODELS
+
+    seeds = seeds or RANDOM_SEEDS
+    jobs = []
+
+    if sweep in ('text', 'all'):
+        for stage_num, stage_name in enumerate(PKL_FILES, 1):
+            for seed in seeds:
+                job = {'job_id': f'text_stage{stage_num}_seed{seed:03d}',
+                       'kind': 'text', 'stage': stage_name, 'seed': seed}
+                if group_duplicates:
+                    job['job_id'] += '_grouped'
+                    job['group_duplicates'] = True
+                jobs.append(job)
+
+    if sweep in ('structured', 'all'):
+        for model in MODELS:
+            for seed in seeds:
+                jobs.append({'job_id': f'structured_{model.lower()}_seed{seed:03d}',
+                             'kind': 'structured', 'model': model, 'seed': seed})
+
+    return jobs
+
+def submit(queue_dir, jobs):
+    """Coordinator: write job specs that are not queued or finished yet"""
+    queue_dir = init_queue(queue_dir)
+    submitted = 0
+
+    for job in jobs:
+        name = f"{job['job_id']}.json"
+        if (queue_dir / 'results' / name).exists():
+            continue
+        if any((queue_dir / sub / name).exists() for sub in ('pending', 'running')):
+            continue
+        _atomic_write_json(dict(job, attempts=0), queue_dir / 'pending' / name)
+        submitted += 1
+
+    print(f"Submitted {submitted} jobs ({len(jobs) - submitted} already queued or done)")
+    return submitted
+
+def requeue_expired(queue_dir, lease_timeout=LEASE_TIMEOUT):
+    """Move running jobs whose lease expired back to pending (or failed)"""
+    queue_dir = Path(queue_dir)
+    now = time.time()
+    requeued = 0
+
+    for path in (queue_dir / 'running').glob('*.json'):
+        try:
+            if now - path.stat().st_mtime < lease_timeout:
+                continue
+            with open(path, encoding='utf-8') as f:
+                job = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue  # finished or being rewritten meanwhile
+
+        target = 'failed' if job.get('attempts', 0) >= MAX_ATTEMPTS else 'pending'
+        try:
+            os.rename(path, queue_dir / target / path.name)
+        except FileNotFoundError:
+            continue  # someone else requeued it first
+        requeued += 1
+        print(f"  Lease expired: {job['job_id']} (worker {job.get('worker')}) -> {target}")
+
+    return requeued
+
+def claim(queue_dir, worker_id):
+    """Claim one pending job by atomic rename; None if the queue is empty"""
+    queue_dir = Path(queue_dir)
+
+    for path in sorted((queue_dir / 'pending').glob('*.json')):
+        running_path = queue_dir / 'running' / path.name
+        try:
+            os.rename(path, running_path)
+            # rename keeps the submit-time mtime; start the lease now so the
+            # claim is not requeued as expired before the spec is rewritten
+            os.utime(running_path)
+            with open(running_path, encoding='utf-8') as f:
+                job = json.load(f)
+        except FileNotFoundError:
+            continue  # claimed by another worker
+        job['attempts'] = job.get('attempts', 0) + 1
+        job['worker'] = worker_id
+        _atomic_write_json(job, running_path)
+        return job, running_path
+
+    return None
+
+def _holds_claim(running_path, job):
+    """True if running_path is still this claim (not requeued and re-claimed by another worker)"""
+    try:
+        with open(running_path, encoding='utf-8') as f:
+            current = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    return current.get('worker') == job['worker'] and current.get('attempts') == job['attempts']
+
+def _heartbeat(path, stop, interval):
+    while not stop.wait(interval):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return  # requeued by someone else; the result is still written
+
+def _structured_data():
+    from .generate_table_2_2_descriptive_statistics import VARIABLES
+    from .experiment_variable_selection import load_structured_data
+
+    X, y = load_structured_data(VARIABLES)
+    return X.values, y
+
+def run_job(job):
+    """Execute one (stage/model, seed) job and return its result row"""
+    if job['kind'] == 'text':
+        from .experiment_text_only_complete_metrics import PKL_FILES, load_stage, evaluate_seed
+
+        if job['stage'] not in _DATA_CACHE:
+            _DATA_CACHE[job['stage']] = load_stage(PKL_FILES[job['stage']])
+        X_full, y_full, row_ids = _DATA_CACHE[job['stage']]
+
+        groups = None
+        if job.get('group_duplicates'):
+            from .dedup_text_minhash import cluster_groups
+            groups = cluster_groups(row_ids)
+
+        result = evaluate_seed(X_full, y_full, job['seed'], groups)
+        return dict(result, stage=job['stage'], group_duplicates=bool(job.get('group_duplicates')))
+
+    if job['kind'] == 'structured':
+        from .experiment_variable_selection import evaluate_model_seed
+
+        if 'structured' not in _DATA_CACHE:
+            _DATA_CACHE['structured'] = _structured_data()
+        X, y = _DATA_CACHE['structured']
+        return evaluate_model_seed(job['model'], X, y, job['seed'])
+
+    raise ValueError(f"Unknown job kind: {job['kind']}")
+
+def run_worker(queue_dir, worker_id=None, lease_timeout=LEASE_TIMEOUT, wait=False):
+    """
+    Worker loop: claim, run, write result, until the queue is drained
+
+    Args:
+        queue_dir: shared queue directory
+        worker_id: defaults to host:pid
+        lease_timeout: seconds without heartbeat before a job is requeued
+        wait: keep polling for new jobs instead of exiting when drained
+
+    Returns:
+        number of jobs completed by this worker
+    """
+    from .results_warehouse import code_version
+
+    queue_dir = init_queue(queue_dir)
+    worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}'
+    version = code_version()
+    completed = 0
+
+    print(f"Worker {worker_id} started on {queue_dir}")
+
+    while True:
+        requeue_expired(queue_dir, lease_timeout)
+        claimed = claim(queue_dir, worker_id)
+
+        if claimed is None:
+            if not wait and not any((queue_dir / 'running').glob('*.json')):
+                break
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        job, running_path = claimed
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=_heartbeat, args=(running_path, stop, lease_timeout / 3),
+                                     daemon=True)
+        heartbeat.start()
+
+        try:
+            started_at = datetime.now(timezone.utc)
+            start = time.perf_counter()
+            result = run_job(job)
+            result['elapsed_seconds'] = time.perf_counter() - start
+            result['started_at'] = started_at.isoformat()
+            result['worker'] = worker_id
+            result['code_version'] = version
+            _atomic_write_json(result, queue_dir / 'results' / running_path.name)
+            target = 'done'
+            completed += 1
+            print(f"  {job['job_id']}: done in {result['elapsed_seconds']:.1f}s")
+        except Exception as e:
+            print(f"\n❌ Error in {job['job_id']}: {e}")
+            target = 'failed' if job['attempts'] >= MAX_ATTEMPTS else 'pending'
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if not _holds_claim(running_path, job):
+            continue  # lease expired meanwhile; the job was requeued or re-claimed
+        try:
+            os.rename(running_path, queue_dir / target / running_path.name)
+        except FileNotFoundError:
+            pass  # lease expired and the job was requeued meanwhile
+
+    print(f"Worker {worker_id} finished: {completed} jobs")
+    return completed
+
+def run_local(queue_dir, n_workers, lease_timeout=LEASE_TIMEOUT):
+    """Run n_workers worker processes on this host (same protocol as remote nodes)"""
+    import multiprocessing
+
+    # host:local-i, so the recorded hosts name this machine like remote host:pid workers
+    host = socket.gethostname()
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(queue_dir, f'{host}:local-{i}', lease_timeout))
+        for i in range(n_workers)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+def structured_output_path(n_seeds):
+    """Table 4-1 raw CSV, named by the number of seeds the sweep ran"""
+    return STRUCTURED_OUTPUT_DIR / f'variable_combination_{n_seeds}iterations_14vars.csv'
+
+def load_results(queue_dir):
+    rows = []
+    for path in sorted((Path(queue_dir) / 'results').glob('*.json')):
+        with open(path, encoding='utf-8') as f:
+            rows.append(json.load(f))
+    return rows
+
+def _run_metadata(results_df):
+    """
+    Warehouse run metadata from the job results: the earliest job start,
+    total job time, the worker hosts (worker ids are host:pid) and the
+    code version(s) the workers ran
+    """
+    started_at = pd.to_datetime(results_df.get('started_at'), utc=True)
+    versions = sorted(set(results_df.get('code_version', pd.Series(dtype=object)).dropna()))
+    if len(versions) > 1:
+        print(f"⚠️  Workers ran different code versions: {', '.join(versions)}")
+    return {
+        'started_at': None if started_at is None or started_at.isna().all() else started_at.min().to_pydatetime(),
+        'elapsed_seconds': results_df['elapsed_seconds'].sum(),
+        'host': ','.join(sorted({worker.rsplit(':', 1)[0] for worker in results_df['worker']})),
+        'version': ','.join(versions) or None,
+    }
+
+def assemble(queue_dir):
+    """Build the per-stage, summary and Table 4-1 raw CSVs from the job results and record the runs"""
+    from .experiment_text_only_complete_metrics import (
+        OUTPUT_DIR, PKL_FILES, experiment_name, save_summary, stage_results_path, summarize_stage
+    )
+    from .results_warehouse import long_results, save_run
+
+    results = load_results(queue_dir)
+    text_rows = [r for r in results if 'stage' in r]
+    structured_rows = [r for r in results if 'Model' in r]
+
+    print(f"Results: {len(text_rows)} text, {len(structured_rows)} structured")
+
+    if text_rows:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        text_df = pd.DataFrame(text_rows)
+        text_df['group_duplicates'] = text_df.get('group_duplicates', False)
+        text_df['group_duplicates'] = text_df['group_duplicates'].fillna(False).astype(bool)
+
+        for group_duplicates, split_df in text_df.groupby('group_duplicates'):
+            all_results = []
+            run_rows, run_stages = [], []
+
+            for stage_name in PKL_FILES:
+                details = split_df[split_df['stage'] == stage_name].sort_values('seed')
+                if details.empty:
+                    continue
+                print(f"\n{stage_name}{' (grouped split)' if group_duplicates else ''}: {len(details)} seeds")
+                details = details[['seed', 'roc_auc', 'pr_auc', 'h_measure', 'recall', 'f1_score']]
+                details.to_csv(stage_results_path(stage_name, group_duplicates), index=False)
+                all_results.append(summarize_stage(stage_name, details))
+                run_rows.append(long_results(details, stage_name, 'LR'))
+                run_stages.append(stage_name)
+
+            save_summary(all_results, group_duplicates)
+            save_run(experiment_name(group_duplicates), pd.concat(run_rows),
+                     sources=[stage_results_path(s, group_duplicates) for s in run_stages],
+                     data_paths=[PKL_FILES[s] for s in run_stages],
+                     skip_recorded=True, **_run_metadata(split_df))
+
+    if structured_rows:
+        structured_df = pd.DataFrame(structured_rows).sort_values(['Model', 'Seed'])
+        structured_df.insert(0, 'Variable_Set', 'Remove_Weak_14')
+        metadata = _run_metadata(structured_df)
+        structured_df = structured_df.drop(columns=['elapsed_seconds', 'started_at', 'worker', 'code_version'],
+                                           errors='ignore')
+        output_path = structured_output_path(structured_df['Seed'].nunique())
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        structured_df.to_csv(output_path, index=False)
+        print(f"\n✓ Structured results saved to: {output_path}")
+        run_rows = [
+            long_results(group.drop(columns=['Variable_Set', 'Model']), 'Remove_Weak_14', model,
+                         seed_col='Seed')
+            for model, group in structured_df.groupby('Model', sort=False)
+        ]
+        save_run('structured', pd.concat(run_rows), sources=[output_path],
+                 data_paths=[config.DATA_PATH], skip_recorded=True, **metadata)
+
+def status(queue_dir):
+    queue_dir = Path(queue_dir)
+    counts = {sub: len(list((queue_dir / sub).glob('*.json'))) for sub in SUBDIRS}
+    print("  ".join(f"{sub}: {n}" for sub, n in counts.items()))
+    return counts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Shared-filesystem sweep queue')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('submit', help='write job specs (coordinator)')
+    p.add_argument('--queue', type=Path, required=True)
+    p.add_argument('--sweep', choices=['text', 'structured', 'all'], default='all')
+    p.add_argument('--seeds', type=int, default=None, help='number of seeds (1..N)')
+    p.add_argument('--group-duplicates', action='store_true',
+                   help='split text jobs by near-duplicate cluster (run dedup_text_minhash.py first)')
+
+    p = sub.add_parser('worker', help='claim and run jobs until the queue is drained')
+    p.add_argument('--queue', type=Path, required=True)
+    p.add_argument('--lease', type=float, default=LEASE_TIMEOUT)
+    p.add_argument('--wait', action='store_true', help='keep polling for new jobs')
+
+    p = sub.add_parser('local', help='run several worker processes on this host')
+    p.add_argument('--queue', type=Path, required=True)
+    p.add_argument('--workers', type=int, default=os.cpu_count())
+    p.add_argument('--lease', type=float, default=LEASE_TIMEOUT)
+
+    p = sub.add_parser('assemble', help='build the summary CSVs from the results')
+    p.add_argument('--queue', type=Path, required=True)
+
+    p = sub.add_parser('status', help='count jobs per state')
+    p.add_argument('--queue', type=Path, required=True)
+
+    args = parser.parse_args(argv)
+    warnings.filterwarnings('ignore')  # model warnings from the jobs this process runs
+
+    if args.command == 'submit':
+        seeds = list(range(1, args.seeds + 1)) if args.seeds else None
+        submit(args.queue, sweep_jobs(args.sweep, seeds, args.group_duplicates))
+    elif args.command == 'worker':
+        run_worker(args.queue, lease_timeout=args.lease, wait=args.wait)
+    elif args.command == 'local':
+        run_local(args.queue, args.workers, lease_timeout=args.lease)
+    elif args.command == 'assemble':
+        assemble(args.queue)
+    elif args.command == 'status':
+        status(args.queue)
+
+if __name__ == '__main__':
+    main()
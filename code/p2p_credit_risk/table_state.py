@@ -0,0 +1,144 @@
+"""
+Mergeable Summary State for Incremental Table Refresh
+Korean P2P Lending Credit Risk Analysis
+
+Used by the Table 2-1, 2-2 and 2-3 generators to fold batches of new loan
+rows into a persisted state instead of re-reading the whole workbook.
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+
+from . import config
+
+# Paths
+STATE_DIR = config.RESULTS_DIR / 'table_state'
+
+# Sketch settings
+MAX_BINS = 4096  # quantiles are exact while a variable has <= MAX_BINS distinct values
+
+class VariableSketch:
+    """
+    Mergeable summary of one numeric variable
+
+    Keeps count, mean and M2 (Chan et al. parallel update), min/max and a
+    value-count histogram for quantiles. The histogram holds exact values
+    until it exceeds MAX_BINS distinct values, after which it is compressed
+    into equal-count centroid bins.
+    """
+
+    def __init__(self, max_bins=MAX_BINS):
+        self.max_bins = max_bins
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def update(self, data):
+        """Fold an array of values (NaN is ignored)"""
+        data = np.asarray(data, dtype=float)
+        data = data[~np.isnan(data)]
+        if len(data) == 0:
+            return self
+
+        other = VariableSketch(self.max_bins)
+        other.n = len(data)
+        other.mean = float(data.mean())
+        other.m2 = float(((data - other.mean) ** 2).sum())
+        other.min = float(data.min())
+        other.max = float(data.max())
+        other.values, other.counts = np.unique(data, return_counts=True)
+        return self.merge(other)
+
+    def merge(self, other):
+        """Fold another sketch into this one"""
+        if other.n == 0:
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta ** 2 * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        values = np.concatenate([self.values, other.values])
+        counts = np.concatenate([self.counts, other.counts])
+        self.values, inverse = np.unique(values, return_inverse=True)
+        self.counts = np.bincount(inverse, weights=counts).astype(np.int64)
+        if len(self.values) > self.max_bins:
+            self._compress()
+        return self
+
+    def _compress(self):
+        """Re-bin into at most max_bins equal-count centroid bins"""
+        cum = np.cumsum(self.counts)
+        groups = ((cum - self.counts) * self.max_bins // cum[-1]).astype(np.int64)
+        counts = np.bincount(groups, weights=self.counts)
+        sums = np.bincount(groups, weights=self.values * self.counts)
+        keep = counts > 0
+        self.values = sums[keep] / counts[keep]
+        self.counts = counts[keep].astype(np.int64)
+
+    def std(self):
+        """Sample standard deviation (ddof=1, as pandas)"""
+        return np.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else np.nan
+
+    def quantile(self, q):
+        """Quantile with linear interpolation (as pandas)"""
+        if self.n == 0:
+            return np.nan
+        h = (self.n - 1) * q
+        lo, hi = int(np.floor(h)), int(np.ceil(h))
+        cum = np.cumsum(self.counts)
+        x_lo = self.values[np.searchsorted(cum, lo, side='right')]
+        x_hi = self.values[np.searchsorted(cum, hi, side='right')]
+        return x_lo + (h - lo) * (x_hi - x_lo)
+
+    def to_dict(self):
+        return {
+            'n': self.n, 'mean': self.mean, 'm2': self.m2,
+            'min': self.min, 'max': self.max,
+            'values': self.values.tolist(), 'counts': self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, d, max_bins=MAX_BINS):
+        sketch = cls(max_bins)
+        sketch.n = d['n']
+        sketch.mean = d['mean']
+        sketch.m2 = d['m2']
+        sketch.min = d['min']
+        sketch.max = d['max']
+        sketch.values = np.asarray(d['values'], dtype=float)
+        sketch.counts = np.asarray(d['counts'], dtype=np.int64)
+        return sketch
+
+def load_state(path):
+    """Load a state file; returns None if it does not exist yet"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    tmp_path.replace(path)
+
+def batch_digest(df):
+    """Content hash of a batch of rows, used to skip batches applied twice"""
+    import hashlib
+    import pandas as pd
+
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
@@ -0,0 +1,11 @@
+"""
+Incremental Refresh of Tables 2-1, 2-2 and 2-3
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/refresh_tables_incremental.py.
+"""
+
+from p2p_credit_risk.refresh_tables_incremental import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+"""
+Local Results Warehouse (SQLite)
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/results_warehouse.py.
+"""
+
+from p2p_credit_risk.results_warehouse import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+"""
+Multi-node Sweep Execution through a Shared-Filesystem Job Queue
+Korean P2P Lending Credit Risk Analysis
+
+Script entry point; the code is in p2p_credit_risk/sweep_queue.py.
+"""
+
+from p2p_credit_risk.sweep_queue import main
+
+if __name__ == '__main__':
+    main()